@@ -7,8 +7,10 @@ This file centralises brand, packaging, paths, formats, and runtime defaults.
 from __future__ import annotations
 import os
 import sys
-import platform
+import functools
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
 
 DEV_MODE = True
 DEV_STARTUP_MOV = r"R:\Digi\faceware_roms\Female_Performance_ROM_02.mov"
@@ -53,7 +55,12 @@ APP_UUID = "{baf9a395-3698-40f2-82b1-d4b183c11232}"
 # Icon file for the application (relative to project root)
 # e.g., "resources/crittr.ico" — set when you add your icon
 APP_ICON = None
-APP_PNG = os.path.join(os.path.dirname(__file__), "crittr", "resources", "images", "crittr.png")
+
+
+@functools.cache
+def app_png() -> str:
+    """Window icon PNG (exposed lazily as APP_PNG)."""
+    return os.path.join(os.path.dirname(__file__), "crittr", "resources", "images", "crittr.png")
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Crittr identity / branding
@@ -88,6 +95,7 @@ BUILD_COMMIT = os.getenv("CRITTR_BUILD_COMMIT", "")[:7]
 BUILD_CHANNEL = os.getenv("CRITTR_BUILD_CHANNEL", "dev")  # dev/beta/stable
 
 
+@functools.cache
 def version_string() -> str:
     """Human-friendly version string for About dialogs and logs."""
     meta = f"+{BUILD_COMMIT}" if BUILD_COMMIT else ""
@@ -98,12 +106,12 @@ def version_string() -> str:
 # ───────────────────────────────────────────────────────────────────────────────
 # Supported formats / detection hints
 # ───────────────────────────────────────────────────────────────────────────────
-VIDEO_EXTS = {
+VIDEO_EXTS = frozenset({
     ".mp4", ".mov", ".avi", ".mkv", ".m4v", ".webm", ".wmv", ".mpg", ".mpeg"
-}
-IMAGE_EXTS = {
+})
+IMAGE_EXTS = frozenset({
     ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".gif", ".exr"
-}
+})
 # Treat numbered image sequences as clips (e.g., frame_0001.png → frame_####.png)
 SEQUENCE_GLOB_CANDIDATES = [
     "*.png", "*.jpg", "*.jpeg", "*.tif", "*.tiff", "*.exr", "*.bmp"
@@ -112,6 +120,8 @@ SEQUENCE_GLOB_CANDIDATES = [
 # Preferred decoding backend (we keep a pluggable abstraction in code)
 DEFAULT_VIDEO_BACKEND = "ffpyplayer"  # or "pyav"
 FFMPEG_THREADS = "auto"               # passed to backend if supported
+SCRUB_THUMB_WIDTH = 256               # keyframe thumbnails shown while dragging the timeline (px)
+SCRUB_THUMB_MAX = 600                 # thumbnails kept per clip, >= 1 s apart; ~65 MB at 256x144
 
 # Bundled resource folder names (used by PyInstaller data files)
 FFMPEG_DIRNAME = "ffmpeg"      # e.g., ffmpeg/avcodec-*.dll
@@ -138,45 +148,112 @@ def resource_path(*parts: str) -> Path:
 
 # ───────────────────────────────────────────────────────────────────────────────
 # User data locations (settings, logs, DB, default projects)
+# Computed lazily so branding-only consumers (build.py, installer) skip them.
+# The legacy UPPER_CASE names still resolve via the module __getattr__ below.
 # ───────────────────────────────────────────────────────────────────────────────
-def _appdata_base() -> Path:
-    system = platform.system()
-    if system == "Windows":
-        base = os.getenv("APPDATA") or (Path.home() / "AppData" / "Roaming")
-    elif system == "Darwin":
-        base = Path.home() / "Library" / "Application Support"
+@functools.cache
+def _platformdirs():
+    """platformdirs module if installed (optional), else None."""
+    try:
+        import platformdirs
+        return platformdirs
+    except ImportError:
+        return None
+
+
+@functools.cache
+def _system() -> str:
+    import platform
+    return platform.system()
+
+
+@functools.cache
+def appdata_dir() -> Path:
+    """Per-user data folder (computed once per process)."""
+    pd = _platformdirs()
+    if pd is not None:
+        # Base dir only (no appname): keeps <config>/DigiMonsters/Crittr on every platform
+        base = pd.user_config_dir(roaming=True)
     else:
-        base = Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config"))
+        system = _system()
+        if system == "Windows":
+            base = os.getenv("APPDATA") or (Path.home() / "AppData" / "Roaming")
+        elif system == "Darwin":
+            base = Path.home() / "Library" / "Application Support"
+        else:
+            base = Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config"))
     return Path(base) / ORG_DIRNAME / APP_NAME
 
 
-APPDATA_DIR = _appdata_base()
-LOG_DIR = APPDATA_DIR / "logs"
-CACHE_DIR = APPDATA_DIR / "cache"
-SETTINGS_FILE = APPDATA_DIR / "settings.ini"  # QSettings (Native) is fine too
-DATABASE_PATH = APPDATA_DIR / "crittr.db"
-DEFAULT_PROJECTS_DIR = Path.home() / "CrittrProjects"
+@functools.cache
+def log_dir() -> Path:
+    pd = _platformdirs()
+    if pd is not None:
+        return Path(pd.user_log_dir(APP_NAME, ORG_DIRNAME))
+    return appdata_dir() / "logs"
+
+
+@functools.cache
+def cache_dir() -> Path:
+    # Local (non-roaming) cache on Windows keeps bulky files out of profile sync
+    pd = _platformdirs()
+    if pd is not None:
+        return Path(pd.user_cache_dir(APP_NAME, ORG_DIRNAME))
+    return appdata_dir() / "cache"
+
+
+@functools.cache
+def settings_file() -> Path:
+    return appdata_dir() / "settings.ini"  # QSettings (Native) is fine too
+
+
+@functools.cache
+def database_path() -> Path:
+    return appdata_dir() / "crittr.db"
+
+
+@functools.cache
+def default_projects_dir() -> Path:
+    return Path.home() / "CrittrProjects"
+
+
+_DIRS_ENSURED = False
 
 
 def ensure_app_dirs() -> None:
-    """Create required folders if they don't exist."""
-    for p in (APPDATA_DIR, LOG_DIR, CACHE_DIR, DEFAULT_PROJECTS_DIR):
-        p.mkdir(parents=True, exist_ok=True)
+    """Create required folders if they don't exist (only does work on the first call)."""
+    global _DIRS_ENSURED
+    if _DIRS_ENSURED:
+        return
+    dirs = {str(p) for p in (appdata_dir(), log_dir(), cache_dir(), default_projects_dir())}
+    # Skip entries that are a parent of another entry; makedirs creates them on the way
+    for d in sorted(dirs):
+        if any(other != d and other.startswith(d + os.sep) for other in dirs):
+            continue
+        os.makedirs(d, exist_ok=True)
+    _DIRS_ENSURED = True
 
 
 # ───────────────────────────────────────────────────────────────────────────────
 # QSettings bootstrap (call once during crittr init)
 # ───────────────────────────────────────────────────────────────────────────────
+_QSETTINGS_ORG_APPLIED = False
+
+
 def apply_qsettings_org() -> None:
     """
     Apply org/crittr metadata for QSettings. Call early in crittr startup,
-    before constructing your first QSettings instance.
+    before constructing your first QSettings instance. Repeat calls are no-ops.
     """
+    global _QSETTINGS_ORG_APPLIED
+    if _QSETTINGS_ORG_APPLIED:
+        return
     try:
         from PySide6.QtCore import QCoreApplication
         QCoreApplication.setOrganizationName(ORG_NAME)
         QCoreApplication.setOrganizationDomain(ORG_DOMAIN)
         QCoreApplication.setApplicationName(APP_NAME)
+        _QSETTINGS_ORG_APPLIED = True
     except Exception:
         # Safe to import this module in non-Qt contexts (e.g., CLI tools)
         pass
@@ -211,57 +288,92 @@ CLI_EXAMPLES = (
 # ───────────────────────────────────────────────────────────────────────────────
 # Defaults / UI hints (read by settings wrapper; safe to change before shipping)
 # ───────────────────────────────────────────────────────────────────────────────
-DEFAULTS = {
-    "video": {
-        "backend": DEFAULT_VIDEO_BACKEND,   # "ffpyplayer" or "pyav"
-        "ffmpeg_threads": FFMPEG_THREADS,   # typically "auto"
-        "max_frame_cache_mb": 512,
-        "prefetch_on_scrub": True,
-    },
-    "overlay": {
-        "default_color": "#ff5a36",
-        "default_width_px": 3,
-        "default_opacity": 1.0,
-        # Ghosting is a Phase 8 feature; defaults here are harmless placeholders
-        "ghosting_frames": 3,               # ±N frames
-        "ghosting_opacity": 0.35,
-        "layers": [
-            {"name": "Notes", "visible": True, "opacity": 1.0, "locked": False},
-        ],
-    },
-    "hotkeys": {
-        "play_pause": "K",
-        "step_prev": "J",
-        "step_next": "L",
-        "bookmark": "B",
-        "note_focus": "N",
-        "pen_tool": "P",
-        "eraser_tool": "E",
-        "increase_brush": "]",
-        "decrease_brush": "[",
-        "compare_toggle": "C",
-    },
-    "paths": {
-        "projects_dir": str(DEFAULT_PROJECTS_DIR),
-        "database": str(DATABASE_PATH),
-        "logs_dir": str(LOG_DIR),
-    },
-}
+@functools.cache
+def defaults() -> Mapping[str, Mapping[str, Any]]:
+    """Nested, read-only settings defaults (exposed lazily as DEFAULTS)."""
+    groups = {
+        "video": {
+            "backend": DEFAULT_VIDEO_BACKEND,   # "ffpyplayer" or "pyav"
+            "ffmpeg_threads": FFMPEG_THREADS,   # typically "auto"
+            "max_frame_cache_mb": 512,          # decoded preview/step frames kept (LRU); ~85 at 1080p
+            "prefetch_on_scrub": True,
+        },
+        "overlay": {
+            "default_color": "#ff5a36",
+            "default_width_px": 3,
+            "default_opacity": 1.0,
+            # Ghosting is a Phase 8 feature; defaults here are harmless placeholders
+            "ghosting_frames": 3,               # ±N frames
+            "ghosting_opacity": 0.35,
+            "layers": [
+                {"name": "Notes", "visible": True, "opacity": 1.0, "locked": False},
+            ],
+        },
+        "hotkeys": {
+            "play_pause": "K",
+            "step_prev": "J",
+            "step_next": "L",
+            "bookmark": "B",
+            "note_focus": "N",
+            "pen_tool": "P",
+            "eraser_tool": "E",
+            "increase_brush": "]",
+            "decrease_brush": "[",
+            "compare_toggle": "C",
+        },
+        "paths": {
+            "projects_dir": str(default_projects_dir()),
+            "database": str(database_path()),
+            "logs_dir": str(log_dir()),
+        },
+    }
+    return MappingProxyType({g: MappingProxyType(d) for g, d in groups.items()})
+
+
+@functools.cache
+def default_items() -> tuple[tuple[str, Any], ...]:
+    """Flat ("group/key", default) pairs, built once for the settings wrapper."""
+    return tuple(
+        (f"{g}/{k}", v)
+        for g, d in defaults().items() if isinstance(d, Mapping)
+        for k, v in d.items()
+    )
 
 # ───────────────────────────────────────────────────────────────────────────────
 # Convenience banner for logs / about dialog
 # ───────────────────────────────────────────────────────────────────────────────
+@functools.cache
 def banner() -> str:
     return (
         f"{APP_NAME} {version_string()}  •  {APP_ID}\n"
         f"Vendor: {COMPANY_NAME}  •  Repo: {REPO_URL}\n"
-        f"Data: {APPDATA_DIR}"
+        f"Data: {appdata_dir()}"
     )
 
 
+# Lazily-resolved legacy constants (PEP 562): `from app_config import LOG_DIR` still works
+_LAZY_CONSTANTS = {
+    "APP_PNG": app_png,
+    "APPDATA_DIR": appdata_dir,
+    "LOG_DIR": log_dir,
+    "CACHE_DIR": cache_dir,
+    "SETTINGS_FILE": settings_file,
+    "DATABASE_PATH": database_path,
+    "DEFAULT_PROJECTS_DIR": default_projects_dir,
+    "DEFAULTS": defaults,
+}
+
+
+def __getattr__(name: str):
+    factory = _LAZY_CONSTANTS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
+
+
 if __name__ == "__main__":
     # Quick sanity check when run directly
     ensure_app_dirs()
     print(banner())
-    print("Projects:", DEFAULT_PROJECTS_DIR)
-    print("DB:      ", DATABASE_PATH)
+    print("Projects:", default_projects_dir())
+    print("DB:      ", database_path())
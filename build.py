@@ -1,3 +1,5 @@
+import functools
+import importlib.machinery
 import os
 import shutil
 import subprocess
@@ -12,6 +14,8 @@ from app_config import APP_NAME, APP_VERSION, COMPANY_NAME, APP_UUID as PRODUCT_
 COMPILE_CYTHON = True
 # Set to True to build the executable with PyInstaller
 BUILD_EXECUTABLE = False
+# Set to True to require a one-folder (COLLECT) spec; avoids per-launch onefile extraction
+BUILD_ONEDIR = True
 # Set to True to create an installer package
 CREATE_INSTALLER = False
 # Set to True to clean up build artifacts after completion
@@ -25,6 +29,12 @@ DIST_DIR = os.path.join(ROOT_DIR, 'dist')
 LOGIC_DIR = os.path.join(ROOT_DIR, 'cython_logic')
 INSTALLER_DIR = os.path.join(ROOT_DIR, 'installer_output')
 
+# Environment shared by every child process (built once, not per call)
+SUBPROCESS_ENV = dict(os.environ)
+SPEC_FILE = os.path.join(ROOT_DIR, 'crittr.spec')
+# Built extension module suffixes for this interpreter (.pyd on Windows, .<tag>.so on Linux/macOS)
+EXTENSION_SUFFIXES = tuple(importlib.machinery.EXTENSION_SUFFIXES)
+
 
 def print_header(title):
     """Prints a formatted header to the console."""
@@ -33,11 +43,20 @@ def print_header(title):
     print("=" * 60)
 
 
+@functools.lru_cache(maxsize=None)
+def resolve_executable(name):
+    """Absolute path for a command name (PATH is scanned once per name)."""
+    if os.path.isabs(name):
+        return name
+    return shutil.which(name) or name
+
+
 def run_command(command, cwd):
     """Runs a command in a specified directory and exits if it fails."""
     print(f"Executing: {' '.join(command)} in {cwd}")
-    # Use shell=True on Windows for compatibility with commands in Scripts/
-    result = subprocess.run(command, cwd=cwd, capture_output=True, text=True, shell=sys.platform == 'win32')
+    # No shell: resolving the executable up front covers commands in Scripts/ without spawning cmd.exe
+    command = [resolve_executable(command[0]), *command[1:]]
+    result = subprocess.run(command, cwd=cwd, capture_output=True, text=True, env=SUBPROCESS_ENV)
     if result.returncode != 0:
         print("Error:")
         print(result.stdout)
@@ -62,14 +81,16 @@ def cleanup():
 
     # Remove generated C files and compiled modules from logic directory
     if os.path.exists(LOGIC_DIR):
-        for item in os.listdir(LOGIC_DIR):
-            item_path = os.path.join(LOGIC_DIR, item)
-            if item.endswith('.c'):
-                os.remove(item_path)
-                print(f"Removed generated C source file: {item}")
-            if item.endswith('.pyd'):
-                shutil.copy(item_path, os.path.join(ROOT_DIR, f"crittr/logic/{os.path.basename(item)}"))
-                os.remove(item_path)
+        target_dir = os.path.join(ROOT_DIR, 'crittr', 'logic')
+        with os.scandir(LOGIC_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith('.c'):
+                    os.unlink(entry.path)
+                    print(f"Removed generated C source file: {name}")
+                elif name.endswith(EXTENSION_SUFFIXES):
+                    # Single rename when on the same filesystem (falls back to copy + unlink)
+                    shutil.move(entry.path, os.path.join(target_dir, name))
 
 
 def compile_cython():
@@ -77,8 +98,24 @@ def compile_cython():
     run_command([sys.executable, 'setup.py', 'build_ext', '--inplace'], cwd=LOGIC_DIR)
 
 
+def spec_is_onedir(spec_path):
+    """True when the spec gathers files with COLLECT() (one-folder) rather than a onefile EXE; OSError if unreadable."""
+    with open(spec_path, encoding='utf-8') as f:
+        return 'COLLECT(' in f.read()
+
+
 def build_executable():
     print_header("Building Executable with PyInstaller")
+    if BUILD_ONEDIR:
+        try:
+            onedir = spec_is_onedir(SPEC_FILE)
+        except OSError as e:
+            print(f"Error: cannot read spec file {SPEC_FILE}: {e}")
+            sys.exit(1)
+        if not onedir:
+            print(f"Error: {SPEC_FILE} is not a one-folder spec (expected COLLECT(...)).")
+            print("Onefile bundles re-extract everything on every launch; switch the spec to onedir.")
+            sys.exit(1)
     try:
         import PyInstaller.__main__
 
@@ -91,7 +128,7 @@ def build_executable():
             print(f"Working directory changed to: {ROOT_DIR}")
 
             # Just run PyInstaller with the spec file
-            PyInstaller.__main__.run(['crittr.spec', '--noconfirm'])
+            PyInstaller.__main__.run(['crittr.spec', '--noconfirm', '--clean'])
         finally:
             # Restore the original working directory
             os.chdir(original_cwd)
@@ -1,33 +1,143 @@
 # crittr/core/settings.py
 from __future__ import annotations
-from typing import Any
-from PySide6.QtCore import QSettings
-from app_config import apply_qsettings_org, DEFAULTS, SETTINGS_FILE
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator
+from PySide6.QtCore import QCoreApplication, QSettings, QThreadPool
+from app_config import apply_qsettings_org, default_items
+
+_MISSING = object()
+
 
 class Settings:
     """
     Thin wrapper over QSettings with defaults and simple dict-like get/set.
     Uses Native format (registry/plist) but we keep a reference file path for diagnostics.
+    Reads are served from an in-memory cache; writes are persisted lazily via flush().
     """
+    __slots__ = ("_qs", "_cache", "_dirty", "_deferred", "_depth", "_defaults", "_pool", "__weakref__")
+
     def __init__(self):
         apply_qsettings_org()
         self._qs = QSettings()
+        self._cache: dict[str, Any] = {}
+        self._dirty: set[str] = set()
+        self._deferred: set[str] = set()   # cache-only writes, pushed to QSettings on flush()
+        self._depth = 0                    # transaction() nesting
+        self._pool: QThreadPool | None = None  # single-thread writer for flush_async(), created on demand
 
-        # Prime defaults if key not present
-        for group, values in DEFAULTS.items():
-            for k, v in values.items() if isinstance(values, dict) else []:
-                self.get(f"{group}/{k}", v)
+        # Flattened defaults; QSettings is only touched on the first get() of a key
+        self._defaults: dict[str, Any] = dict(default_items())
+
+        # Persist whatever is pending when the app shuts down; the single barrier for flush_async()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
 
     def get(self, key: str, default: Any = None) -> Any:
-        val = self._qs.value(key, default)
-        return val if val is not None else default
+        val = self._cache.get(key, _MISSING)
+        if val is _MISSING:
+            val = self._qs.value(key, None)
+            self._cache[key] = val
+        if val is None:
+            return default if default is not None else self._defaults.get(key)
+        return val
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, persist: bool = True) -> None:
+        """
+        Update a value. persist=False keeps it in memory only until the next flush();
+        use it for high-churn keys (e.g. playhead position while scrubbing).
+        """
+        if self._cache.get(key, _MISSING) == value:
+            return
+        self._cache[key] = value
+        if not persist:
+            self._deferred.add(key)
+            return
+        self._deferred.discard(key)
         self._qs.setValue(key, value)
-        self._qs.sync()
+        self._dirty.add(key)
+
+    def flush(self) -> None:
+        """Persist pending writes (call on shutdown or at natural checkpoints)."""
+        if self._depth:
+            return
+        if self._pool is not None:
+            self._pool.waitForDone()  # let queued flush_async() writes land first
+        for key in self._deferred:
+            self._qs.setValue(key, self._cache[key])
+            self._dirty.add(key)
+        self._deferred.clear()
+        if self._dirty:
+            self._qs.sync()
+            self._dirty.clear()
+
+    def flush_async(self) -> None:
+        """
+        Like flush(), but the QSettings writes and sync() run on a QThreadPool worker so a slow
+        disk (network home, registry) never stalls the UI. The cache is already up to date.
+        """
+        if self._depth or not self._deferred:
+            return
+        items = [(key, self._cache[key]) for key in self._deferred]
+        self._deferred.clear()
+
+        def _write() -> None:
+            # QSettings is reentrant: a worker-owned instance may share the same store
+            qs = QSettings()
+            for key, value in items:
+                qs.setValue(key, value)
+            qs.sync()
+
+        pool = self._pool
+        if pool is None:
+            pool = self._pool = QThreadPool()
+            pool.setMaxThreadCount(1)  # writes land in submission order
+        pool.start(_write)
+
+    @contextmanager
+    def transaction(self) -> Iterator["Settings"]:
+        """Group several set() calls; a single flush() runs when the outermost block exits."""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
 
     def begin_group(self, group: str): self._qs.beginGroup(group)
     def end_group(self): self._qs.endGroup()
 
+def _key_property(key: str, default: Any) -> property:
+    def fget(self: Settings) -> Any:
+        return self.get(key, default)
+
+    def fset(self: Settings, value: Any) -> None:
+        self.set(key, value)
+
+    return property(fget, fset, doc=f"Settings value for '{key}' (default: {default!r}).")
+
+
+def _install_key_properties(cls: type) -> None:
+    """Attribute-style access for every known key: "video/backend" -> settings.video_backend."""
+    for key, default in default_items():
+        name = key.replace("/", "_")
+        if not hasattr(cls, name):
+            setattr(cls, name, _key_property(key, default))
+
+
+_install_key_properties(Settings)
+
+
+_SINGLETON: Settings | None = None
+_SINGLETON_LOCK = threading.Lock()
+
 def get_settings() -> Settings:
-    return Settings()
+    """Return the process-wide Settings instance (created on first use)."""
+    global _SINGLETON
+    if _SINGLETON is None:
+        with _SINGLETON_LOCK:
+            if _SINGLETON is None:
+                _SINGLETON = Settings()
+    return _SINGLETON
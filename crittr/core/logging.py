@@ -1,17 +1,42 @@
 from __future__ import annotations
+import atexit
+import queue
+import sys
 import logging, logging.handlers
 from pathlib import Path
 from datetime import datetime
-from app_config import APP_NAME, COMPANY_NAME, LOG_DIR
+from app_config import APP_NAME, COMPANY_NAME, DEV_MODE, LOG_DIR
 
-LOG_DIR.mkdir(parents=True, exist_ok=True)
-LOG_FILE = LOG_DIR / f"{APP_NAME.lower()}.log"
+_APP_NAME_LOWER = APP_NAME.lower()
+# The folder is created by setup_logging(), so importing this module never touches the filesystem
+LOG_FILE = LOG_DIR / f"{_APP_NAME_LOWER}.log"
 
-def setup_logging(level: int = logging.INFO) -> logging.Logger:
+# Background writer for file/console handlers (see setup_logging)
+_LISTENER: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    global _LISTENER
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        for h in _LISTENER.handlers:
+            h.close()
+        _LISTENER = None
+
+
+atexit.register(_stop_listener)
+
+
+def setup_logging(level: int = logging.INFO, force: bool = False) -> logging.Logger:
+    """Configure the root logger once; pass force=True to rebuild handlers (e.g. in tests)."""
+    global _LISTENER
     logger = logging.getLogger()  # root
+    if getattr(logger, "_crittr_configured", False) and not force:
+        return logger
     logger.setLevel(level)
 
     # Clear duplicate handlers if reinit
+    _stop_listener()
     for h in list(logger.handlers):
         logger.removeHandler(h)
 
@@ -21,18 +46,29 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
     )
 
     # Rotating file
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
     fh = logging.handlers.RotatingFileHandler(
         LOG_FILE, maxBytes=10_000_000, backupCount=5, encoding="utf-8"
     )
     fh.setFormatter(fmt)
     fh.setLevel(level)
-    logger.addHandler(fh)
 
-    # Console (dev only)
-    ch = logging.StreamHandler()
-    ch.setFormatter(fmt)
-    ch.setLevel(level)
-    logger.addHandler(ch)
+    handlers: list[logging.Handler] = [fh]
+
+    # Console (dev only); windowed/frozen builds have no console to write to
+    stderr = sys.stderr
+    if stderr is not None and (DEV_MODE or stderr.isatty()):
+        ch = logging.StreamHandler()
+        ch.setFormatter(fmt)
+        ch.setLevel(level)
+        handlers.append(ch)
+
+    # UI/decode threads only enqueue records; file + console I/O happens on the listener thread
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(q))
+    _LISTENER = logging.handlers.QueueListener(q, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+    logger._crittr_configured = True
 
     logger.info("%s logging initialised • %s • %s", APP_NAME, COMPANY_NAME, LOG_FILE)
     return logger
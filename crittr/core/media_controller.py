@@ -7,16 +7,18 @@ from crittr.core.video import VideoBackendFFPyPlayer
 from crittr.core.logging import get_logger
 
 
-def pts_to_ms(pts_s: float) -> int:
-    return int(round(max(0.0, float(pts_s)) * 1000.0))
+try:
+    # Compiled kernels (cython_logic/timing.pyx, built by build.py)
+    from crittr.logic.timing import pts_to_ms, ms_to_pts, frame_of
+except ImportError:
+    def pts_to_ms(pts_s: float) -> int:
+        return int(round(max(0.0, float(pts_s)) * 1000.0))
 
+    def ms_to_pts(ms: int) -> float:
+        return max(0, int(ms)) / 1000.0
 
-def ms_to_pts(ms: int) -> float:
-    return max(0, int(ms)) / 1000.0
-
-
-def frame_of(pts_s: float, fps_est: float) -> int:
-    return int(round(max(0.0, float(pts_s)) * max(1e-6, float(fps_est))))
+    def frame_of(pts_s: float, fps_est: float) -> int:
+        return int(round(max(0.0, float(pts_s)) * max(1e-6, float(fps_est))))
 
 
 class MediaController(QtCore.QObject):
@@ -24,7 +26,7 @@ class MediaController(QtCore.QObject):
     Owns canonical media time and decoding backend.
     pts_s (float seconds) is the only canonical timeline value.
     """
-    timeChanged = QtCore.Signal(float)                 # pts_s
+    timeChanged = QtCore.Signal(float)                 # pts_s (open/seek only; playback uses frameReady)
     durationChanged = QtCore.Signal(float)             # duration_s
     frameReady = QtCore.Signal(object, float)          # (rgb: np.ndarray, pts_s)
     ended = QtCore.Signal()
@@ -40,12 +42,19 @@ class MediaController(QtCore.QObject):
         self.duration_known: bool = False
         self.fps_est: float = 24.0  # hint, not a clock
 
-        # EMA stability for fps estimate (used only for frame_of/stepping, never as a clock)
-        self._ema_alpha = 0.1
+        # fps estimate window (used only for frame_of/stepping, never as a clock): the backend's
+        # decoded-frame count at the anchor pts, folded into fps_est once a second of media has played.
+        # Decoded, not delivered: the mailbox drops frames exactly when the UI is under load.
+        self._fps_anchor: float = 0.0
+        self._fps_count: int = -1  # -1: re-anchor on the next playback frame
 
         # Play state (controller perspective)
         self.is_playing: bool = False
 
+        # Set when a frame step was served from the read-ahead cache: the backend decoder is still at
+        # the old position and is re-seeked here lazily, on the next play()
+        self._reseek_pts: Optional[float] = None
+
     # Core controls
     def open(self, path: str) -> None:
         self._log.info("MediaController.open(%s)", path)
@@ -60,12 +69,15 @@ class MediaController(QtCore.QObject):
         # Create backend
         self._backend = VideoBackendFFPyPlayer(path)
         self._backend.frame_ready.connect(self._on_backend_frame)
+        self._backend.preview_ready.connect(self._on_backend_preview)
         self._backend.ended.connect(self._on_backend_ended)
 
         # Reset model
         self.pts_s = 0.0
         self.is_playing = False
         self.fps_est = 24.0
+        self._fps_anchor, self._fps_count = 0.0, -1
+        self._reseek_pts = None
 
         # Obtain duration if available (metadata or OpenCV probe)
         dur = None
@@ -94,6 +106,9 @@ class MediaController(QtCore.QObject):
     def play(self) -> None:
         if not self._backend or self.is_playing:
             return
+        if self._reseek_pts is not None:
+            self._backend.seek_to_time(self._reseek_pts)
+            self._reseek_pts = None
         # If the thread is already running, just resume; otherwise start it.
         try:
             if self._backend.is_running():
@@ -118,6 +133,8 @@ class MediaController(QtCore.QObject):
         """Precise seek; leaves backend paused at that position."""
         if not self._backend:
             return None
+        self.cancel_previews()
+        self._reseek_pts = None
         got = self._backend.seek_to_time(max(0.0, float(pts_s)))
         if got is not None:
             arr, pts = got
@@ -125,12 +142,46 @@ class MediaController(QtCore.QObject):
             self.is_playing = False
         return got
 
-    def preview_frame_at(self, pts_s: float) -> Optional[np.ndarray]:
-        """Fast preview during scrubbing; does not change backend state."""
+    def step_to_time(self, pts_s: float, frame_s: float) -> Optional[tuple[np.ndarray, float]]:
+        """
+        Frame step: like seek_to_time(), but served from the backend's read-ahead cache when the frame
+        is already decoded, and by decoding on from the paused player (no seek) for short forward
+        steps. The cache is kept filled 2 frames behind and 5 ahead of the new position.
+        """
+        if not self._backend:
+            return None
+        pts_s = max(0.0, float(pts_s))
+        rgb = self._backend.cached_frame(pts_s)
+        if rgb is None:
+            got = None
+            if pts_s > self.pts_s:
+                self.pause()
+                self.cancel_previews()
+                got = self._backend.advance_to(pts_s)
+            if got is None:
+                got = self.seek_to_time(pts_s)
+            else:
+                self._reseek_pts = None  # the decoder itself is at the new position
+                self._publish_frame(got[0], got[1])
+        else:
+            self.pause()
+            self.cancel_previews()
+            self._reseek_pts = pts_s
+            self._publish_frame(rgb, pts_s)
+            got = (rgb, pts_s)
+        # Refill only when the window edge is not cached yet (steps inside the window decode nothing)
+        lo, hi = pts_s - 2.0 * frame_s, pts_s + 5.0 * frame_s
+        backend = self._backend
+        if backend.cached_frame(hi) is None or backend.cached_frame(max(0.0, lo)) is None:
+            backend.prefetch_span(lo, hi)
+        return got
+
+    def preview_frame_at(self, pts_s: float, exact: bool = False) -> Optional[np.ndarray]:
+        """Fast preview during scrubbing (keyframe-snapped unless exact); does not change backend state."""
         if not self._backend:
             return None
         try:
-            rgb = self._backend.get_preview_frame_at(max(0.0, float(pts_s)))
+            rgb = self._backend.get_preview_frame_at(max(0.0, float(pts_s)), exact=exact)
         except Exception:
             rgb = None
         if rgb is not None:
@@ -138,18 +189,69 @@ class MediaController(QtCore.QObject):
             self.frameReady.emit(rgb, float(pts_s))
         return rgb
 
+    def request_preview(self, pts_s: float, exact: bool = False) -> None:
+        """Queue a scrub preview without blocking; the frame arrives via frameReady."""
+        if not self._backend:
+            return
+        self._backend.request_preview(max(0.0, float(pts_s)), exact)
+
+    def snap_to_keyframe(self, pts_s: float, direction: int = -1) -> Optional[float]:
+        """Keyframe at/before (direction < 0) or at/after pts_s; None until the backend has indexed them."""
+        if not self._backend:
+            return None
+        return self._backend.snap_to_keyframe(max(0.0, float(pts_s)), direction)
+
+    def thumbnail_at(self, pts_s: float) -> Optional[np.ndarray]:
+        """Low-res keyframe thumbnail for scrubbing (no decode); None where the backend has none yet."""
+        if not self._backend:
+            return None
+        return self._backend.thumbnail_at(max(0.0, float(pts_s)))
+
+    def cancel_previews(self) -> None:
+        if self._backend:
+            self._backend.cancel_previews()
+
     # Internals
-    @QtCore.Slot(object, float)
-    def _on_backend_frame(self, rgb, pts: float) -> None:
-        """Backend decode → controller: update pts_s, fps_est (EMA), and publish events."""
-        # Update fps_est from PTS deltas (EMA); never used as canonical clock
-        dt = max(1e-6, float(pts) - float(self.pts_s))
-        self.fps_est = (1.0 - self._ema_alpha) * self.fps_est + self._ema_alpha * (1.0 / dt)
+    @QtCore.Slot(object)
+    def hold_frame(self, arr: np.ndarray) -> None:
+        """Mark the buffer a view is displaying (zero-copy) so the backend ring does not overwrite it."""
+        if self._backend is not None:
+            self._backend.hold_buffer(arr)
 
-        self._publish_frame(rgb, float(pts))
+    @QtCore.Slot(int, float)
+    def _on_backend_frame(self, slot: int, pts: float) -> None:
+        """Backend decode → controller: update pts_s, fps_est (once per second), and publish the frame."""
+        backend = self._backend
+        if backend is None or self.sender() is not backend:
+            return  # late delivery from a backend that has since been replaced
+        # The signal only wakes us; show the newest decoded frame (frames decoded meanwhile are dropped)
+        got = backend.take_frame()
+        if got is None:
+            return  # superseded by a seek
+        slot, pts, count = got
+        rgb = backend.get_buffer(slot)
+        # The estimate is refreshed once per second of media, from frames decoded in that span
+        span = pts - self._fps_anchor
+        if span >= 1.0 or span <= 0.0 or self._fps_count < 0:
+            if span > 0.0 and self._fps_count >= 0:
+                self.fps_est = (count - self._fps_count) / span
+            self._fps_anchor, self._fps_count = pts, count
+        # Per-frame path: a single emission; frameReady carries pts_s for slider/clock sync
+        self.pts_s = pts if pts > 0.0 else 0.0
+        self.frameReady.emit(rgb, self.pts_s)
+
+    @QtCore.Slot(object, float, int)
+    def _on_backend_preview(self, rgb, pts: float, gen: int) -> None:
+        # Results are queued across threads: one decoded before a seek/cancel (or by a replaced
+        # backend) can arrive after it, and would snap the view back to an older position
+        backend = self._backend
+        if backend is None or self.sender() is not backend or gen != backend.preview_generation():
+            return
+        self.frameReady.emit(rgb, float(pts))
 
     def _publish_frame(self, rgb, pts: float) -> None:
         self.pts_s = max(0.0, float(pts))
+        self._fps_count = -1  # a jump is not a frame interval
         # Emit canonical time first so views can update slider before the frame if needed
         self.timeChanged.emit(self.pts_s)
         # Then the frame itself
@@ -1,11 +1,15 @@
 from __future__ import annotations
+import functools
 import threading
-from typing import Optional, Tuple
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
 import numpy as np
 import time
 
-from app_config import FFMPEG_THREADS
+from app_config import FFMPEG_THREADS, SCRUB_THUMB_MAX, SCRUB_THUMB_WIDTH
 from crittr.qt import QtCore
+from crittr.core.config import get_settings
 from crittr.core.logging import get_logger
 import cv2
 
@@ -14,10 +18,62 @@ try:
 except Exception:
     MediaPlayer = None
 
+try:
+    # Compiled row copy (cython_logic/frame_ops.pyx, built by build.py)
+    from crittr.logic.frame_ops import unpack_rgb24
+except ImportError:
+    unpack_rgb24 = None
+
+try:
+    import av  # PyAV: keyframe-snapped scrub previews
+except Exception:
+    av = None
+
+# Exact previews grab() forward instead of re-seeking when the target is at most this far ahead
+_PREVIEW_GRAB_AHEAD_MS = 1000.0
+# Likewise, forward steps keep decoding from the paused player (no seek/flush) up to this far ahead
+_STEP_DECODE_AHEAD_S = 1.0
+
+# Pooled frame buffers; frame_ready carries a slot index and a slot is rewritten only after
+# FRAME_RING_SIZE newer frames. At most one frame_ready is queued at a time (see take_frame()), so
+# the ring only has to outlast the displayed buffer plus one pending delivery. ~6 MB per slot at 1080p.
+FRAME_RING_SIZE = 8
+
+# Frame pacing: shorter delays aren't worth a sleep; longer ones are capped to bound stop() latency
+_PACE_MIN_DELAY_S = 0.002
+_PACE_MAX_DELAY_S = 0.1
+
+
+@functools.lru_cache(maxsize=8)
+def _frame_copier(w: int, h: int, stride: int) -> Callable[[memoryview, np.ndarray], None]:
+    """
+    Copy routine specialised for one (w, h, stride) plane layout, built once per stream shape.
+    Callers must pass planes of at least (h - 1) * stride + 3 * w bytes (see _img_to_slot).
+    """
+    if unpack_rgb24 is not None:
+        # One memcpy (packed) or one per row (padded), without the GIL
+        def copy(buf, dst):
+            unpack_rgb24(buf, h, w, stride, dst)
+    elif stride == 3 * w:
+        n = h * stride
+
+        # Tightly packed rows: a plain reshape is already a (h, w, 3) view
+        def copy(buf, dst):
+            np.copyto(dst, np.frombuffer(buf, dtype=np.uint8, count=n).reshape(h, w, 3))
+    else:
+        strides = (stride, 3, 1)
+
+        # Padded rows: stride over the padding instead of slicing + reshaping
+        def copy(buf, dst):
+            flat = np.frombuffer(buf, dtype=np.uint8)
+            np.copyto(dst, np.lib.stride_tricks.as_strided(flat, shape=(h, w, 3), strides=strides))
+    return copy
+
 
 class VideoBackendFFPyPlayer(QtCore.QObject):
     """FFmpeg-backed backend with real pause/resume and fast scrubbing preview."""
-    frame_ready = QtCore.Signal(np.ndarray, float)  # (rgb, pts_s)
+    frame_ready = QtCore.Signal(int, float)  # (ring slot, pts_s); frame via get_buffer(slot)
+    preview_ready = QtCore.Signal(np.ndarray, float, int)  # (bgr, requested_s, generation) from request_preview()
     ended = QtCore.Signal()
 
     def __init__(self, path: str):
@@ -35,7 +91,9 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
                 "an": 1,
                 "fflags": "genpts",
                 "sync": "video",
-                "out_fmt": "rgb24",
+                # Qt-native BGR888, same layout as the OpenCV preview. The YUV->BGR swscale runs on
+                # ffpyplayer's own decoder thread, pipelined with decoding; _loop only copies the result.
+                "out_fmt": "bgr24",
                 "framedrop": "1",
             },
             loglevel="warning",
@@ -43,27 +101,77 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
 
         self._running = False
         self._paused = False
+        self._player_paused = False  # last state pushed via set_pause(); see _set_player_paused()
+        self._decoded_pts: Optional[float] = None  # pts of the last frame pulled from the player
         self._cond = threading.Condition()
         self._thread: Optional[threading.Thread] = None
 
+        # Preview decoders, opened lazily: PyAV (keyframe + exact), OpenCV only as a fallback
+        self._cv_cap: Optional[cv2.VideoCapture] = None
+        self._av_container = None
+        self._av_stream = None
+        self._preview_lock = threading.Lock()  # serialises the preview decoders
+        self._preview_closed = False  # set by close() under _preview_lock; decoders stay closed after
+        # (frame index, exact) -> decoded preview; back-and-forth scrubs become dict hits
+        self._preview_cache: OrderedDict[Tuple[int, bool], np.ndarray] = OrderedDict()
+        # The cache is bounded by bytes (video/max_frame_cache_mb), so 4K clips keep fewer frames
+        self._cache_bytes: int = 0
+        try:
+            self._cache_max_bytes = int(float(get_settings().get("video/max_frame_cache_mb")) * 1024 * 1024)
+        except (TypeError, ValueError) as ex:
+            self._log.debug("Invalid video/max_frame_cache_mb, preview cache disabled: %s", ex)
+            self._cache_max_bytes = 0
+
         # Metadata / duration cache
         self._duration: Optional[float] = None
+        self._frame_s: float = 1.0 / 24.0  # nominal frame duration; bounds the seek drain
         try:
             md = self._player.get_metadata() or {}
             dur = md.get("duration")
             if dur is not None:
                 self._duration = float(dur)
                 self._log.info("Duration (s): %.3f", self._duration)
+            rate = md.get("frame_rate")
+            if rate and rate[0] > 0 and rate[1] > 0:
+                self._frame_s = float(rate[1]) / float(rate[0])
         except Exception as ex:
             self._log.debug("No/invalid metadata: %s", ex)
         if self._duration is None:
-            probed = self._probe_duration_via_opencv()
+            probed = self._probe_duration_via_av()
             if probed and 0 < probed < 24 * 60 * 60:
                 self._duration = probed
-                self._log.info("OpenCV-probed duration (s): %.3f", self._duration)
-
-        # Preview capture (OpenCV) for scrubbing
-        self._cv_cap: Optional[cv2.VideoCapture] = None
+                self._log.info("PyAV-probed duration (s): %.3f", self._duration)
+
+        # Scrub preview worker: decodes only the newest pending target (see request_preview)
+        self._preview_cond = threading.Condition()
+        self._preview_target: Optional[Tuple[float, bool]] = None
+        self._prefetch_span: Optional[Tuple[float, float]] = None  # step read-ahead; served when idle
+        self._preview_gen = 0
+        self._preview_alive = False
+        self._preview_thread: Optional[threading.Thread] = None
+
+        # Keyframe times (seconds, sorted), demuxed once in the background; None until ready
+        self._kf_times: Optional[np.ndarray] = None
+        # Scrub thumbnails (sorted times + BGR arrays), filled progressively after the keyframe index
+        self._thumb_times: list[float] = []
+        self._thumbs: list[np.ndarray] = []
+        self._thumbs_done = False
+        self._kf_abort = threading.Event()
+        if av is not None:
+            threading.Thread(target=self._build_keyframe_index, daemon=True, name="CrittrKeyframes").start()
+
+        # Frame ring (allocated once the frame shape is known); see get_buffer()/hold_buffer()
+        self._ring: list[np.ndarray] = []
+        self._ring_idx: int = 0
+        self._held: Optional[np.ndarray] = None  # buffer currently displayed; skipped by the decoder
+        # Latest-wins hand-off to the UI thread: (slot, pts_s, decoded count) of the newest undelivered frame
+        self._mailbox: Optional[Tuple[int, float, int]] = None
+        self._decoded_count: int = 0  # frames the loop has decoded, delivered to the UI or not
+        self._mail_lock = threading.Lock()
+        # Plane layout of the stream, learned from the first frame (see _img_to_slot)
+        self._fixed_nbytes: int = -1
+        self._fixed_shape: Tuple[int, int, int] = (0, 0, 3)
+        self._fixed_copy: Optional[Callable[[memoryview, np.ndarray], None]] = None
 
     # ──────────────────────────────────────────────────────────────────────────
     # Public API
@@ -71,6 +179,23 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
     def get_duration(self) -> Optional[float]:
         return self._duration
 
+    def get_buffer(self, slot: int) -> np.ndarray:
+        """(h, w, 3) uint8 BGR buffer for a frame_ready slot index."""
+        return self._ring[slot]
+
+    def take_frame(self) -> Optional[Tuple[int, float, int]]:
+        """
+        Newest undelivered (slot, pts_s, decoded_count), or None if a later delivery already took it.
+        decoded_count also counts frames the mailbox dropped, for rate estimates.
+        """
+        with self._mail_lock:
+            got, self._mailbox = self._mailbox, None
+        return got
+
+    def hold_buffer(self, arr: np.ndarray) -> None:
+        """Mark the buffer a view is displaying (zero-copy) so the ring does not overwrite it."""
+        self._held = arr
+
     def start(self) -> None:
         if self._running:
             self._log.debug("start() ignored: already running")
@@ -88,11 +213,8 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
             if not self._running:
                 return
             self._paused = True
-            try:
-                # Stop ffpyplayer from queuing/buffering in the background.
-                self._player.set_pause(True)
-            except Exception as ex:
-                self._log.debug("player.set_pause(True) failed: %s", ex)
+            # Stop ffpyplayer from queuing/buffering in the background.
+            self._set_player_paused(True)
             self._cond.notify_all()
 
     def resume(self) -> None:
@@ -101,10 +223,7 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
             if not self._running:
                 return
             self._paused = False
-            try:
-                self._player.set_pause(False)
-            except Exception as ex:
-                self._log.debug("player.set_pause(False) failed: %s", ex)
+            self._set_player_paused(False)
             self._cond.notify_all()
         # NOTE: Do NOT call get_frame() here. The decode loop owns get_frame().
 
@@ -124,16 +243,38 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
     def close(self) -> None:
         """Fully close the player and preview resources."""
         self.stop()
+        self._kf_abort.set()
+        with self._preview_cond:
+            self._preview_alive = False
+            self._preview_target = None
+            self._prefetch_span = None
+            self._preview_cond.notify_all()
+        t = self._preview_thread
+        self._preview_thread = None
+        if t and t.is_alive():
+            t.join(timeout=1.0)
         try:
             self._player.close_player()
         except Exception as ex:
             self._log.warning("Error closing player: %s", ex)
-        if self._cv_cap is not None:
-            try:
-                self._cv_cap.release()
-            except Exception:
-                pass
-        self._cv_cap = None
+        # A decode that outlived the join still holds _preview_lock; tear down only after it
+        with self._preview_lock:
+            self._preview_closed = True
+            if self._cv_cap is not None:
+                try:
+                    self._cv_cap.release()
+                except Exception:
+                    pass
+            self._cv_cap = None
+            self._cache_bytes = 0
+            if self._av_container is not None:
+                try:
+                    self._av_container.close()
+                except Exception:
+                    pass
+            self._av_container = None
+            self._av_stream = None
+            self._preview_cache.clear()
 
     def is_running(self) -> bool:
         return self._running
@@ -142,23 +283,329 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
         return self._paused
 
     # ──────────────────────────────────────────────────────────────────────────
-    # Scrub preview (OpenCV)
+    # Scrub preview (PyAV, OpenCV fallback)
     # ──────────────────────────────────────────────────────────────────────────
-    def get_preview_frame_at(self, seconds: float) -> Optional[np.ndarray]:
-        """Fast-ish preview frame using OpenCV, independent of the decode loop."""
+    def get_preview_frame_at(self, seconds: float, exact: bool = False) -> Optional[np.ndarray]:
+        """
+        Preview frame independent of the decode loop.
+        exact=False (dragging): nearest preceding keyframe, one decode per call.
+        exact=True (released): decode forward to the requested time.
+        """
+        seconds = max(0.0, float(seconds))
+        if not exact:
+            # Every target inside a GOP shows the same keyframe, so they share one cache entry
+            kf = self.snap_to_keyframe(seconds)
+            if kf is not None:
+                seconds = kf
+        idx = self._frame_index(seconds)
+        with self._preview_lock:
+            cache = self._preview_cache
+            # An exact frame also satisfies a keyframe request for the same index
+            for key in ((idx, True),) if exact else ((idx, True), (idx, False)):
+                bgr = cache.get(key)
+                if bgr is not None:
+                    cache.move_to_end(key)
+                    return bgr
+            got = self._av_preview_at(seconds, exact)
+            if got is not None:
+                bgr, t = got
+                if t is not None:
+                    idx = int(round(t / self._frame_s))  # key by the decoded frame, as _av_prefetch does
+            else:
+                bgr = self._cv_preview_at(seconds)
+            if bgr is not None:
+                self._cache_put((idx, exact), bgr)
+            return bgr
+
+    def _cache_put(self, key: Tuple[int, bool], bgr: np.ndarray) -> None:
+        # Caller holds _preview_lock; evicts least recently used frames until within the byte budget
+        cache = self._preview_cache
+        old = cache.pop(key, None)
+        if old is not None:
+            self._cache_bytes -= old.nbytes
+        if bgr.nbytes > self._cache_max_bytes:
+            return
+        cache[key] = bgr
+        self._cache_bytes += bgr.nbytes
+        while self._cache_bytes > self._cache_max_bytes:
+            _, old = cache.popitem(last=False)
+            self._cache_bytes -= old.nbytes
+
+    def snap_to_keyframe(self, seconds: float, direction: int = -1) -> Optional[float]:
+        """
+        Keyframe time at/before (direction < 0) or at/after (direction >= 0) `seconds`, clamped to
+        the first/last keyframe. O(log n); None until the background index is ready.
+        """
+        kf = self._kf_times
+        if kf is None or kf.size == 0:
+            return None
+        if direction < 0:
+            i = int(np.searchsorted(kf, seconds, side="right")) - 1
+        else:
+            i = int(np.searchsorted(kf, seconds, side="left"))
+        return float(kf[min(max(i, 0), kf.size - 1)])
+
+    def _build_keyframe_index(self) -> None:
+        """Demux (no decode) the video stream once and record keyframe times; runs on a worker thread."""
+        container = None
+        try:
+            container = av.open(self._path)
+            stream = container.streams.video[0]
+            tb = float(stream.time_base)
+            pts = []
+            for pkt in container.demux(stream):
+                if self._kf_abort.is_set():
+                    return
+                if pkt.is_keyframe and pkt.pts is not None:
+                    pts.append(pkt.pts)
+            self._kf_times = np.unique(np.asarray(pts, dtype=np.int64)) * tb
+            self._log.debug("Keyframe index: %d keyframes", self._kf_times.size)
+        except Exception as ex:
+            self._log.debug("Keyframe index unavailable: %s", ex)
+        finally:
+            if container is not None:
+                try:
+                    container.close()
+                except Exception:
+                    pass
+        self._build_thumbnails()
+
+    def thumbnail_at(self, seconds: float) -> Optional[np.ndarray]:
+        """Small BGR thumbnail of the last sampled keyframe at/before `seconds`; None where not covered yet."""
+        times = self._thumb_times
+        i = bisect_right(times, seconds) - 1
+        if i < 0 or (i == len(times) - 1 and not self._thumbs_done):
+            return None  # before the first thumbnail, or past what the background pass has reached
+        return self._thumbs[i]
+
+    def _build_thumbnails(self) -> None:
+        """Decode keyframes only (one sequential pass, no seeks) into scrub thumbnails >= 1 s apart."""
+        if SCRUB_THUMB_MAX <= 0 or self._kf_abort.is_set():
+            return
+        container = None
+        try:
+            container = av.open(self._path)
+            stream = container.streams.video[0]
+            stream.codec_context.skip_frame = "NONKEY"
+            w, h = stream.codec_context.width, stream.codec_context.height
+            tw = min(SCRUB_THUMB_WIDTH, w)
+            th = max(2, int(round(tw * h / w)) & ~1)
+            step = max(1.0, (self._duration or 0.0) / SCRUB_THUMB_MAX)
+            next_t = 0.0
+            for frame in container.decode(stream):
+                if self._kf_abort.is_set():
+                    return
+                t = frame.time
+                if t is None or t < next_t:
+                    continue
+                # Array first, then its time: thumbnail_at() indexes _thumbs by position in _thumb_times
+                self._thumbs.append(frame.to_ndarray(format="bgr24", width=tw, height=th))
+                self._thumb_times.append(t)
+                next_t = t + step
+                if len(self._thumbs) >= SCRUB_THUMB_MAX:
+                    break  # capped: the tail stays uncovered (falls back to decoded previews)
+            else:
+                self._thumbs_done = True
+            self._log.debug("Scrub thumbnails: %d at %dx%d", len(self._thumbs), tw, th)
+        except Exception as ex:
+            self._log.debug("Scrub thumbnails unavailable: %s", ex)
+        finally:
+            if container is not None:
+                try:
+                    container.close()
+                except Exception:
+                    pass
+
+    def request_preview(self, seconds: float, exact: bool = False) -> None:
+        """
+        Non-blocking scrub preview: records the target and wakes the preview worker, which emits
+        preview_ready. Targets that arrive while a decode is running replace each other, so only the
+        newest one is decoded next; a pending exact request is never replaced by an inexact one.
+        """
+        with self._preview_cond:
+            pending = self._preview_target
+            if pending is not None and pending[1] and not exact:
+                return
+            self._preview_target = (max(0.0, float(seconds)), exact)
+            self._wake_preview_worker()
+
+    def prefetch_span(self, start_s: float, end_s: float) -> None:
+        """
+        Decode [start_s, end_s] in the background (one keyframe seek, sequential decode) into the
+        exact-frame cache, for cached_frame(). Runs only while no scrub preview is pending; a newer
+        span replaces one that has not started yet.
+        """
+        if av is None:
+            return
+        with self._preview_cond:
+            self._prefetch_span = (max(0.0, float(start_s)), max(0.0, float(end_s)))
+            self._wake_preview_worker()
+
+    def cached_frame(self, seconds: float) -> Optional[np.ndarray]:
+        """Exact frame showing at `seconds` if it is already cached (never decodes, never blocks)."""
+        return self._preview_cache.get((self._frame_index(max(0.0, float(seconds))), True))
+
+    def _frame_index(self, seconds: float) -> int:
+        """Index of the frame on screen at `seconds`: each frame covers [pts, pts + frame_s)."""
+        return int(seconds / self._frame_s + 1e-3)  # tolerance: float error right at a frame start
+
+    def _wake_preview_worker(self) -> None:
+        # Caller holds _preview_cond
+        if self._preview_thread is None:
+            self._preview_alive = True
+            self._preview_thread = threading.Thread(
+                target=self._preview_loop, daemon=True, name="CrittrPreview"
+            )
+            self._preview_thread.start()
+        self._preview_cond.notify()
+
+    def cancel_previews(self) -> None:
+        """Drop the pending target and suppress results of a decode already in progress."""
+        with self._preview_cond:
+            self._preview_target = None
+            self._preview_gen += 1
+
+    def preview_generation(self) -> int:
+        """Current cancel generation; preview_ready results stamped with an older one are stale."""
+        return self._preview_gen
+
+    def _preview_loop(self) -> None:
+        while True:
+            with self._preview_cond:
+                while self._preview_target is None and self._prefetch_span is None and self._preview_alive:
+                    self._preview_cond.wait()
+                if not self._preview_alive:
+                    return
+                target = self._preview_target
+                if target is None:
+                    # Idle: scrub previews always win over read-ahead
+                    span, self._prefetch_span = self._prefetch_span, None
+                else:
+                    self._preview_target = None
+                    gen = self._preview_gen
+            if target is None:
+                self._av_prefetch(*span)
+                continue
+            seconds, exact = target
+            bgr = self.get_preview_frame_at(seconds, exact=exact)
+            if bgr is None:
+                continue
+            with self._preview_cond:
+                if gen != self._preview_gen:
+                    continue
+            self.preview_ready.emit(bgr, seconds, gen)
+
+    def _open_av(self) -> bool:
+        """Open the PyAV preview container on first use; it shares no state with the playing decoder."""
+        if self._av_container is not None:
+            return True
+        if av is None or self._preview_closed:
+            return False
+        try:
+            self._av_container = av.open(self._path)
+            self._av_stream = self._av_container.streams.video[0]
+            self._av_stream.thread_type = "AUTO"
+            return True
+        except Exception as ex:
+            self._log.debug("PyAV preview: cannot open container: %s", ex)
+            if self._av_container is not None:
+                try:
+                    self._av_container.close()
+                except Exception:
+                    pass
+            self._av_container = None
+            self._av_stream = None
+            return False
+
+    def _av_preview_at(self, seconds: float, exact: bool) -> Optional[Tuple[np.ndarray, Optional[float]]]:
+        if not self._open_av():
+            return None
+        try:
+            stream = self._av_stream
+            # any_frame=False: FFmpeg lands on the keyframe at/before the target
+            self._av_container.seek(int(seconds / stream.time_base), stream=stream, any_frame=False, backward=True)
+            last = None
+            for frame in self._av_container.decode(stream):
+                last = frame
+                # Exact: decode forward (no conversion) until the frame on screen at `seconds`
+                if not exact or frame.time is None or frame.time + self._frame_s > seconds:
+                    break
+            if last is None:
+                return None
+            return last.to_ndarray(format="bgr24"), last.time
+        except Exception as ex:
+            self._log.debug("PyAV preview failed at %.3f s: %s", seconds, ex)
+            return None
+
+    def _av_prefetch(self, start_s: float, end_s: float) -> None:
+        frame_s = self._frame_s
+        with self._preview_lock:
+            if not self._open_av():
+                return
+            cache = self._preview_cache
+            try:
+                stream = self._av_stream
+                self._av_container.seek(int(start_s / stream.time_base), stream=stream, any_frame=False, backward=True)
+                for frame in self._av_container.decode(stream):
+                    t = frame.time
+                    if t is None or t + frame_s <= start_s:
+                        continue  # before the span: decode only, no conversion
+                    if t > end_s:
+                        break
+                    key = (int(round(t / frame_s)), True)
+                    if key in cache:
+                        cache.move_to_end(key)
+                        continue
+                    self._cache_put(key, frame.to_ndarray(format="bgr24"))
+            except Exception as ex:
+                self._log.debug("PyAV prefetch failed for %.3f-%.3f s: %s", start_s, end_s, ex)
+
+    def _open_cv_capture(self) -> Optional[cv2.VideoCapture]:
+        """FFmpeg capture with any available hardware decoder (NVDEC/D3D11/VAAPI/VideoToolbox...), else software."""
+        try:
+            cap = cv2.VideoCapture(
+                self._path, cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY, cv2.CAP_PROP_HW_DEVICE, 0],
+            )
+            if cap.isOpened():
+                self._log.debug("OpenCV preview: hw acceleration=%s", cap.get(cv2.CAP_PROP_HW_ACCELERATION))
+                return cap
+            cap.release()
+        except Exception as ex:
+            # Older OpenCV builds lack the HW properties / params constructor
+            self._log.debug("OpenCV preview: hw capture unavailable: %s", ex)
+        cap = cv2.VideoCapture(self._path)
+        if not cap.isOpened():
+            self._log.debug("OpenCV preview: cannot open capture")
+            cap.release()
+            return None
+        return cap
+
+    def _cv_preview_at(self, seconds: float) -> Optional[np.ndarray]:
         try:
             if self._cv_cap is None:
-                self._cv_cap = cv2.VideoCapture(self._path)
-                if not self._cv_cap.isOpened():
-                    self._log.debug("OpenCV preview: cannot open capture")
-                    self._cv_cap.release()
-                    self._cv_cap = None
+                if self._preview_closed:
+                    return None
+                self._cv_cap = self._open_cv_capture()
+                if self._cv_cap is None:
                     return None
-            self._cv_cap.set(cv2.CAP_PROP_POS_MSEC, max(0.0, float(seconds)) * 1000.0)
-            ok, bgr = self._cv_cap.read()
+            cap = self._cv_cap
+            target_ms = seconds * 1000.0
+            pos_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+            if pos_ms < target_ms <= pos_ms + _PREVIEW_GRAB_AHEAD_MS:
+                # Short forward hop: grab() skips frames without converting them; retrieve() only the last
+                while pos_ms < target_ms:
+                    if not cap.grab():
+                        return None
+                    pos_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+                ok, bgr = cap.retrieve()
+            else:
+                cap.set(cv2.CAP_PROP_POS_MSEC, target_ms)
+                ok, bgr = cap.read()
             if not ok or bgr is None:
                 return None
-            return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+            # FrameView draws BGR888 directly; no per-frame channel swap
+            return bgr
         except Exception as ex:
             self._log.debug("OpenCV preview failed at %.3f s: %s", seconds, ex)
             return None
@@ -166,13 +613,17 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
     # ──────────────────────────────────────────────────────────────────────────
     # Precise seek (poster frame)
     # ──────────────────────────────────────────────────────────────────────────
-    def seek_to_time(self, seconds: float, poster_timeout_ms: int = 3000) -> Optional[Tuple[np.ndarray, float]]:
+    def seek_to_time(self, seconds: float, poster_timeout_ms: int = 3000,
+                     accurate: bool = True) -> Optional[Tuple[np.ndarray, float]]:
         """
-        Seek to absolute time (seconds). Returns (frame_rgb, pts_s) at/after requested time.
+        Seek to absolute time (seconds). Returns (frame_bgr, pts_s) for the frame showing at that time
+        (accurate=False: the first frame after the keyframe seek).
         Keeps the decode thread paused during the operation to avoid races.
         """
         target_s = max(0.0, float(seconds))
-        self._log.info("seek_to_time(seconds=%.3f)", target_s)
+        self._log.info("seek_to_time(seconds=%.3f, accurate=%s)", target_s, accurate)
+        # A frame is on screen for [pts, pts + frame_s); stop draining at the first one that covers target_s
+        reach_s = target_s - self._frame_s if accurate else float("-inf")
 
         # Ensure the decode thread is paused so it won't consume frames while we seek.
         was_playing = False
@@ -180,50 +631,80 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
             was_playing = self._running and not self._paused
             self._paused = True
             self._cond.notify_all()
+        self.take_frame()  # a playback frame still waiting for the UI is older than the seek
 
         try:
             # Temporarily unpause ffpyplayer so get_frame() can advance to the poster frame.
-            try:
-                self._player.set_pause(False)
-            except Exception:
-                pass
+            self._set_player_paused(False)
 
-            self._player.seek(target_s, relative=False)
-
-            deadline = time.monotonic() + (poster_timeout_ms / 1000.0)
-            last = None
-            while time.monotonic() < deadline:
-                frame, val = self._player.get_frame()
-                if val == 'eof':
-                    break
-                if frame is None:
-                    time.sleep(0.003)
-                    continue
-                img, pts = frame
-                if pts is None:
-                    continue
-                pts_f = float(pts)
-                last = (img, pts_f)
-                if pts_f >= target_s:
-                    break
+            self._player.seek(target_s, relative=False, accurate=accurate)
+            self._decoded_pts = None
+            last = self._drain_until(reach_s, time.monotonic() + (poster_timeout_ms / 1000.0))
 
             if last is None:
                 self._log.warning("seek_to_time: could not reach requested time")
                 return None
 
-            arr = self._img_to_numpy(last[0])
-            if arr is None:
+            slot = self._img_to_slot(last[0])
+            if slot is None:
                 return None
-            return (arr, last[1])
+            return (self._ring[slot], last[1])
 
         finally:
-            # Restore paused state to match UI: stay paused unless we were playing before.
-            try:
-                self._player.set_pause(True)
-            except Exception:
-                pass
+            self.take_frame()  # likewise anything the loop deposited while it was being paused
+            # Restore paused state to match UI: stay paused unless we were playing before
+            # (in which case the player is still unpaused and only the loop needs waking).
             if was_playing:
-                self.resume()  # will set_pause(False) and wake the loop
+                self.resume()
+            else:
+                self._set_player_paused(True)
+
+    def advance_to(self, seconds: float, timeout_ms: int = 1000) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Forward step without seeking: while paused, keep pulling frames from the player until the one
+        showing at `seconds`. No decoder flush and no re-decode from the keyframe; returns None when
+        the target is not a short way ahead of the decoder (the caller seeks instead).
+        """
+        target_s = float(seconds)
+        with self._cond:
+            if self._running and not self._paused:
+                return None
+        pos = self._decoded_pts
+        if pos is None or not pos < target_s <= pos + _STEP_DECODE_AHEAD_S:
+            return None
+        self.take_frame()
+        try:
+            self._set_player_paused(False)
+            last = self._drain_until(target_s - self._frame_s, time.monotonic() + timeout_ms / 1000.0)
+            if last is None or last[1] + self._frame_s <= target_s:
+                return None  # EOF/timeout short of the target
+            slot = self._img_to_slot(last[0])
+            if slot is None:
+                return None
+            return (self._ring[slot], last[1])
+        finally:
+            self.take_frame()
+            self._set_player_paused(True)
+
+    def _drain_until(self, reach_s: float, deadline: float) -> Optional[Tuple[object, float]]:
+        """Pull frames (decode thread paused) until one past reach_s, EOF or the deadline; returns the last."""
+        last = None
+        while time.monotonic() < deadline:
+            frame, val = self._player.get_frame()
+            if val == 'eof':
+                break
+            if frame is None:
+                time.sleep(0.003)
+                continue
+            img, pts = frame
+            if pts is None:
+                continue
+            pts_f = float(pts)
+            last = (img, pts_f)
+            self._decoded_pts = pts_f
+            if pts_f > reach_s:
+                break
+        return last
 
     # ──────────────────────────────────────────────────────────────────────────
     # Decode loop
@@ -236,18 +717,16 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
                 with self._cond:
                     if not self._running:
                         break
-                    # Pause gate
+                    # Pause gate: resume()/stop() notify, so no periodic wakeups while paused
                     while self._paused and self._running:
-                        self._cond.wait(timeout=0.1)
+                        self._cond.wait()
                     if not self._running:
                         break
-                    # Make sure ffpyplayer isn't paused when we intend to play
-                    try:
-                        self._player.set_pause(False)
-                    except Exception:
-                        pass
+                    # Make sure ffpyplayer isn't paused when we intend to play (no-op if it isn't)
+                    self._set_player_paused(False)
 
-                # Decode one frame
+                # Decode one frame. Demux and decode run ahead inside ffpyplayer (bounded packet and
+                # picture queues on its own threads); get_frame() is the paced consumer of that queue.
                 try:
                     frame, val = self._player.get_frame()
                 except Exception as ex:
@@ -261,65 +740,135 @@ class VideoBackendFFPyPlayer(QtCore.QObject):
                     self.ended.emit()
                     break
                 if frame is None:
-                    QtCore.QThread.msleep(5)
+                    # Nothing decoded yet: wait as long as ffpyplayer suggests (pause/stop still wake us)
+                    idle = val if isinstance(val, float) and val > 0 else 0.005
+                    with self._cond:
+                        if self._running and not self._paused:
+                            self._cond.wait(timeout=min(idle, _PACE_MAX_DELAY_S))
                     continue
 
                 img, pts = frame
-                arr = self._img_to_numpy(img)
-                if arr is None:
+                slot = self._img_to_slot(img)
+                if slot is None:
                     continue
                 pts_f = float(pts or 0.0)
+                self._decoded_pts = pts_f
 
                 # Pacing: trust ffpyplayer's recommended delay (val)
-                if isinstance(val, float) and val > 0:
-                    # Sleep in small chunks so we remain responsive to pause/stop
-                    waited = 0.0
-                    while waited < val and self._running and not self._paused:
-                        chunk = min(0.02, val - waited)
-                        time.sleep(chunk)
-                        waited += chunk
-
-                self.frame_ready.emit(arr, pts_f)
+                if isinstance(val, float) and val >= _PACE_MIN_DELAY_S:
+                    # One timed wait; pause()/stop() notify _cond and cut it short
+                    with self._cond:
+                        if self._running and not self._paused:
+                            self._cond.wait(timeout=min(val, _PACE_MAX_DELAY_S))
+
+                # Only an int crosses the thread boundary; the receiver looks the buffer up.
+                # At most one delivery is queued: while the UI is busy, newer frames replace the
+                # mailbox entry instead of piling events up, so stale frames are dropped, not shown late.
+                with self._mail_lock:
+                    self._decoded_count += 1
+                    notify = self._mailbox is None
+                    self._mailbox = (slot, pts_f, self._decoded_count)
+                if notify:
+                    self.frame_ready.emit(slot, pts_f)
         finally:
             self._log.debug("Decode loop exited")
 
     # ──────────────────────────────────────────────────────────────────────────
     # Helpers
     # ──────────────────────────────────────────────────────────────────────────
-    def _img_to_numpy(self, img) -> Optional[np.ndarray]:
-        try:
-            w, h = img.get_size()
-            buf = img.to_bytearray()[0]
-            line_sizes = None
+    def _set_player_paused(self, paused: bool) -> None:
+        """Call set_pause() only on an actual state change; each call enters ffpyplayer's C layer."""
+        with self._cond:
+            if self._player_paused == paused:
+                return
             try:
-                line_sizes = img.get_linesize()
-            except Exception:
-                pass
-            stride = int(line_sizes[0]) if line_sizes else 3 * w
-            flat = np.frombuffer(buf, dtype=np.uint8)
-            if flat.size < h * stride:
-                return None
-            return flat.reshape(h, stride)[:, : 3 * w].reshape(h, w, 3)
+                self._player.set_pause(paused)
+                self._player_paused = paused
+            except Exception as ex:
+                self._log.debug("player.set_pause(%s) failed: %s", paused, ex)
+
+    def _next_slot(self, shape: Tuple[int, int, int]) -> int:
+        """Next reusable ring slot; reallocates the ring when the frame shape changes."""
+        ring = self._ring
+        if not ring or ring[0].shape != shape:
+            ring = [np.empty(shape, dtype=np.uint8) for _ in range(FRAME_RING_SIZE)]
+            self._ring = ring
+            self._ring_idx = 0
+        slot = self._ring_idx
+        self._ring_idx = (slot + 1) % FRAME_RING_SIZE
+        if ring[slot] is self._held:
+            slot = self._ring_idx
+            self._ring_idx = (slot + 1) % FRAME_RING_SIZE
+        return slot
+
+    def _img_to_slot(self, img) -> Optional[int]:
+        """Copy a decoded frame into the next ring buffer and return its slot index."""
+        try:
+            # Borrow ffpyplayer's plane (no copy); it is copied into the ring buffer below
+            buf = img.to_memoryview(keep_align=True)[0]
+            if buf.nbytes != self._fixed_nbytes:
+                # First frame or a layout change: learn the layout (slow path)
+                if not self._learn_layout(img, buf):
+                    return None
+            slot = self._next_slot(self._fixed_shape)
+            self._fixed_copy(buf, self._ring[slot])
+            return slot
         except Exception as ex:
             self._log.error("Failed converting frame to numpy: %s", ex)
             return None
 
-    def _probe_duration_via_opencv(self) -> Optional[float]:
-        cap = None
+    def _learn_layout(self, img, buf: memoryview) -> bool:
+        w, h = img.get_size()
+        line_sizes = None
         try:
-            cap = cv2.VideoCapture(self._path)
-            if not cap.isOpened():
-                return None
-            frames = cap.get(cv2.CAP_PROP_FRAME_COUNT)
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            if fps and fps > 0 and frames and frames > 0:
-                return float(frames) / float(fps)
+            line_sizes = img.get_linesize(keep_align=True)
         except Exception:
             pass
-        finally:
-            if cap is not None:
-                try:
-                    cap.release()
-                except Exception:
-                    pass
+        stride = int(line_sizes[0]) if line_sizes else 3 * w
+        if stride < 3 * w or buf.nbytes < (h - 1) * stride + 3 * w:
+            return False
+        self._fixed_nbytes = buf.nbytes
+        self._fixed_shape = (h, w, 3)
+        self._fixed_copy = _frame_copier(w, h, stride)
+        self._log.debug("Frame layout: %dx%d stride=%d", w, h, stride)
+        return True
+
+    def _probe_duration_via_av(self) -> Optional[float]:
+        if not self._open_av():
+            return None
+        # Container/stream headers only; no decoder is touched
+        try:
+            dur = self._av_container.duration
+            if dur:
+                return float(dur) / av.time_base
+            stream = self._av_stream
+            if stream.frames and stream.average_rate:
+                return stream.frames / float(stream.average_rate)
+        except Exception:
+            pass
+        return None
+
+
+def poster_thumbnail(path: str, max_w: int, max_h: int) -> Optional[np.ndarray]:
+    """First keyframe of `path` as a BGR array fitted in max_w x max_h (keyframe-only decode); None without PyAV."""
+    if av is None:
         return None
+    container = None
+    try:
+        container = av.open(path)
+        stream = container.streams.video[0]
+        stream.codec_context.skip_frame = "NONKEY"
+        w, h = stream.codec_context.width, stream.codec_context.height
+        k = min(max_w / w, max_h / h, 1.0)
+        tw, th = max(2, int(w * k) & ~1), max(2, int(h * k) & ~1)
+        for frame in container.decode(stream):
+            return frame.to_ndarray(format="bgr24", width=tw, height=th)
+    except Exception as ex:
+        get_logger(__name__).debug("Poster thumbnail unavailable for %s: %s", path, ex)
+    finally:
+        if container is not None:
+            try:
+                container.close()
+            except Exception:
+                pass
+    return None
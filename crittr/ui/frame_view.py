@@ -5,47 +5,119 @@ from crittr.qt import QtCore, QtGui, QtWidgets
 
 class FrameView(QtWidgets.QLabel):
     """
-    Simple frame view. Accepts numpy RGB frames and shows them.
+    Simple frame view. Accepts numpy BGR frames (the decoder/preview layout) and shows them.
     Future: replace with a custom paintable canvas for annotations.
     """
+    frameShown = QtCore.Signal(object)  # ndarray now backing the displayed image
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.setMinimumSize(320, 180)
         self.setAlignment(QtCore.Qt.AlignCenter)
         self.setStyleSheet("background-color: #222;")
         self._qimage: Optional[QtGui.QImage] = None
+        self._frame: Optional[np.ndarray] = None  # keeps the buffer behind _qimage alive
+        # Scaled copy of _qimage for the current widget size; dropped on new frame or resize
+        self._scaled: Optional[QtGui.QImage] = None
+        self._scaled_size = QtCore.QSize()
+        self._scaled_of: Optional[QtGui.QImage] = None  # source image _scaled was made from
+        # Smooth scaling for stills (paused); FastTransformation while frames are streaming
+        self._smooth: bool = True
+        # Scale straight to device pixels so drawImage() is a 1:1 blit on high-DPI screens
+        self._dpr: float = self.devicePixelRatioF()
+        # Low-res scrub thumbnail on screen (see set_preview); drawn with a "PREVIEW" badge
+        self._is_preview: bool = False
 
     @staticmethod
-    def _np_to_qimage(rgb: np.ndarray) -> QtGui.QImage:
-        # rgb shape expected (h, w, 3), uint8
+    def _np_to_qimage(rgb: np.ndarray, fmt: QtGui.QImage.Format = QtGui.QImage.Format.Format_BGR888) -> QtGui.QImage:
+        # shape expected (h, w, 3), uint8; channel order given by fmt (BGR888 by default)
         h, w, ch = rgb.shape
         assert ch == 3
+        if not rgb.flags.c_contiguous:
+            # Strided views (e.g. row-padded or cropped arrays) need packed rows here
+            rgb = np.ascontiguousarray(rgb)
         bytes_per_line = 3 * w
-        # copy() is important to avoid showing garbage when numpy buffer changes
-        return QtGui.QImage(rgb.data, w, h, bytes_per_line, QtGui.QImage.Format.Format_RGB888).copy()
+        # No copy: the image wraps the array; set_frame() keeps it referenced and frameShown
+        # tells the pool owner not to hand it back to the decoder while it is on screen
+        return QtGui.QImage(rgb.data, w, h, bytes_per_line, fmt)
 
     @QtCore.Slot(object)
     def set_frame(self, rgb: np.ndarray) -> None:
         try:
+            if not rgb.flags.c_contiguous:
+                rgb = np.ascontiguousarray(rgb)
             self._qimage = self._np_to_qimage(rgb)
+            self._frame = rgb
+            self._scaled = None
+            self._scaled_of = None  # release the previous frame's scaled copy with it
+            self._is_preview = False
             self.update()
+            self.frameShown.emit(rgb)
         except Exception:
             # Defensive: ignore malformed frames
             pass
 
+    def set_preview(self, bgr: np.ndarray) -> None:
+        """Show a low-res scrub thumbnail, scaled up like any frame and marked as a preview."""
+        self.set_frame(bgr)
+        self._is_preview = self._frame is bgr
+
     def paintEvent(self, e: QtGui.QPaintEvent) -> None:
         super().paintEvent(e)
         if not self._qimage:
             return
         p = QtGui.QPainter(self)
-        target = QtCore.QRectF(self.rect())
-        # FastTransformation is much cheaper per-frame; we can switch to Smooth when paused or for stills later.
-        scaled = QtGui.QImage(self._qimage).scaled(
-            target.size().toSize(),
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.FastTransformation,
-        )
-        x = (self.width() - scaled.width()) / 2
-        y = (self.height() - scaled.height()) / 2
+        if not self._smooth:
+            # Streaming: let the paint engine scale during the blit, so no scaled copy is
+            # allocated per frame (the source is already a zero-copy wrap of the decoder buffer)
+            img = self._qimage
+            iw, ih = img.width(), img.height()
+            k = min(self.width() / iw, self.height() / ih)
+            target = QtCore.QRectF((self.width() - iw * k) / 2, (self.height() - ih * k) / 2, iw * k, ih * k)
+            p.drawImage(target, img)
+            self._paint_badge(p, target.x(), target.y())
+            p.end()
+            return
+        size = self.size()
+        scaled = self._scaled
+        if scaled is None or self._scaled_size != size or self._scaled_of is not self._qimage:
+            dpr = self._dpr
+            # FastTransformation is much cheaper per-frame; Smooth is only used for stills.
+            mode = (QtCore.Qt.TransformationMode.SmoothTransformation if self._smooth
+                    else QtCore.Qt.TransformationMode.FastTransformation)
+            scaled = self._qimage.scaled(size * dpr, QtCore.Qt.AspectRatioMode.KeepAspectRatio, mode)
+            scaled.setDevicePixelRatio(dpr)
+            self._scaled = scaled
+            self._scaled_size = size
+            self._scaled_of = self._qimage
+        logical = scaled.deviceIndependentSize()
+        x = (self.width() - logical.width()) / 2
+        y = (self.height() - logical.height()) / 2
         p.drawImage(QtCore.QPointF(x, y), scaled)
+        self._paint_badge(p, x, y)
         p.end()
+
+    def _paint_badge(self, p: QtGui.QPainter, x: float, y: float) -> None:
+        if self._is_preview:
+            badge = QtCore.QRectF(x + 8, y + 8, 64, 18)
+            p.fillRect(badge, QtGui.QColor(0, 0, 0, 150))
+            p.setPen(QtGui.QColor("#e3e6ea"))
+            p.drawText(badge, QtCore.Qt.AlignmentFlag.AlignCenter, "PREVIEW")
+
+    def set_smooth(self, smooth: bool) -> None:
+        """Smooth scaling for stills (paused); fast scaling while playing or scrubbing."""
+        if smooth == self._smooth:
+            return
+        self._smooth = smooth
+        self._scaled = None
+        self.update()
+
+    def resizeEvent(self, e: QtGui.QResizeEvent) -> None:
+        self._scaled = None
+        super().resizeEvent(e)
+
+    def changeEvent(self, e: QtCore.QEvent) -> None:
+        # Moving to a screen with a different scale factor changes the device-pixel target
+        if e.type() == QtCore.QEvent.Type.DevicePixelRatioChange:
+            self._dpr = self.devicePixelRatioF()
+            self._scaled = None
+        super().changeEvent(e)
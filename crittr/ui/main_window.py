@@ -1,19 +1,80 @@
 # crittr/ui/main_window.py
 from __future__ import annotations
+import functools
 from crittr.qt import QtCore, QtGui, QtWidgets
 from crittr.core.config import get_settings
 from crittr.ui.player_widget import PlayerWidget
 # from crittr.ui.notes_view import NotesPanel
 # from crittr.ui.timeline import NotesPanel
 from crittr.ui.inspector_tabs import InspectorTabs
-from app_config import APP_NAME, APP_PNG
+from app_config import APP_NAME, app_png
 from crittr.ui.timeline.notes_controller import NotesController
 
+
+# File → Open filter
+_MEDIA_EXT_LIST = (
+    "mp4", "mov", "avi", "mkv", "m4v", "webm", "wmv", "mpg", "mpeg",
+    "png", "jpg", "jpeg", "tif", "tiff", "bmp", "exr",
+)
+_MEDIA_FILTER = "Media Files ({})".format(" ".join(f"*.{ext}" for ext in _MEDIA_EXT_LIST))
+
+
+@functools.cache
+def _app_icon() -> QtGui.QIcon:
+    """Window icon, decoded once per process (needs a QGuiApplication, hence lazy)."""
+    return QtGui.QIcon(app_png())
+
+
+# Queue delay after which a scrub dispatch counts as "behind" and stale decodes are dropped
+_SCRUB_LATENCY_BUDGET_MS = 50
+
+
+class _ScrubDispatcher(QtCore.QObject):
+    """
+    Single-slot, latest-wins hand-off from pill drags to the controller's preview worker.
+    Drag updates only overwrite the slot; one queued dispatch per event-loop turn forwards the newest.
+    """
+    scrubLatencyExceeded = QtCore.Signal(float)  # ms the dispatch waited in the event queue
+
+    def __init__(self, ctrl, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._ctrl = ctrl
+        self._pending: float | None = None
+        self._posted = False
+        self._clock = QtCore.QElapsedTimer()
+
+    def post(self, pts_s: float) -> None:
+        self._pending = pts_s
+        if self._posted:
+            return
+        self._posted = True
+        self._clock.start()
+        QtCore.QMetaObject.invokeMethod(self, "_dispatch", QtCore.Qt.ConnectionType.QueuedConnection)
+
+    def cancel(self) -> None:
+        self._pending = None
+
+    @QtCore.Slot()
+    def _dispatch(self) -> None:
+        self._posted = False
+        t, self._pending = self._pending, None
+        if t is None:
+            return
+        lag = self._clock.elapsed()
+        if lag > _SCRUB_LATENCY_BUDGET_MS:
+            # UI is backed up: whatever the worker is decoding is already stale
+            self._ctrl.cancel_previews()
+            self.scrubLatencyExceeded.emit(float(lag))
+        self._ctrl.request_preview(t)
+
+
 class MainWindow(QtWidgets.QMainWindow):
+    _devStartupMediaFound = QtCore.Signal(str)  # DEV_STARTUP_MOV exists (emitted from a pool thread)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_NAME)
-        self.setWindowIcon(QtGui.QIcon(APP_PNG))
+        self.setWindowIcon(_app_icon())
         self.resize(1200, 720)
         self.settings = get_settings()
 
@@ -55,11 +116,15 @@ class MainWindow(QtWidgets.QMainWindow):
     def _open_dialog(self):
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, "Open media", self.settings.get("paths/last_open_dir", ""),
-            "Media Files (*.mp4 *.mov *.avi *.mkv *.m4v *.webm *.wmv *.mpg *.mpeg *.png *.jpg *.jpeg *.tif *.tiff *.bmp *.exr)"
+            _MEDIA_FILTER,
+            # Skip per-entry custom icon lookups and symlink resolution (slow on network shares)
+            options=(QtWidgets.QFileDialog.Option.DontUseCustomDirectoryIcons
+                     | QtWidgets.QFileDialog.Option.DontResolveSymlinks),
         )
         if not path:
             return
-        self.settings.set("paths/last_open_dir", QtCore.QFileInfo(path).absolutePath())
+        self.settings.set("paths/last_open_dir", QtCore.QFileInfo(path).absolutePath(), persist=False)
+        self.settings.flush_async()
         self.player.open(path)
         # Duration will be updated via controller signal wiring
 
@@ -70,63 +135,30 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Update timeline duration when known
         self.player.controller.durationChanged.connect(np.set_duration)
-        # Forward current player time (seconds PTS) to notes panel
-        self.player.controller.timeChanged.connect(np.set_current_time)
-
-        # Bridge notes panel signals to player via controller to decouple UI from playback
-        self.notes_controller = NotesController(self.player, np)
-
-        # Group header click → seek to group start (paused seek)
-        def _on_group_activated(layer_id: str, start_s: float, end_s: float):
-            try:
-                self.player.pause()
-            except Exception:
-                pass
-            try:
-                self.player.controller.seek_to_time(float(start_s))
-            except Exception:
-                pass
-
-        np.groupActivated.connect(_on_group_activated)
-
-        # Note activation → seek to note start (paused seek)
-        def _on_note_activated(note_id: str, start_s: float, end_s: float, layer_id: str):
-            try:
-                self.player.pause()
-            except Exception:
-                pass
-            try:
-                self.player.controller.seek_to_time(float(start_s))
-            except Exception:
-                pass
-
-        np.noteActivated.connect(_on_note_activated)
-
-        # Pill scrubbing hooks
-        def _on_pill_drag_started(note_id: str, s: float, e: float):
-            try:
-                self.player.pause()
-            except Exception:
-                pass
-
-        def _on_pill_dragging(note_id: str, s: float, e: float, preview_t: float):
-            try:
-                self.player.controller.preview_frame_at(float(preview_t))
-            except Exception:
-                pass
-
-        def _on_pill_drag_finished(note_id: str, s: float, e: float, commit: bool):
-            center = 0.5 * (float(s) + float(e))
-            try:
-                self.player.controller.seek_to_time(center)
-            except Exception:
-                pass
-
-        np.notePillDragStarted.connect(_on_pill_drag_started)
-        np.notePillDragging.connect(_on_pill_dragging)
-        np.notePillDragFinished.connect(_on_pill_drag_finished)
+        # Forward current player time (seconds PTS) to notes panel. frameReady alone covers seeks and
+        # playback: every seek also emits timeChanged, which would update the panel twice.
+        self._notes_panel = np
+        self.player.controller.frameReady.connect(self._on_frame_time)
+
+        # Bridge notes panel signals to player via controller to decouple UI from playback;
+        # activation/pill-drag → playback is wired below, once, not also by the NotesController
+        self.notes_controller = NotesController(self.player, np, wire_playback=False)
+
+        # Header/note activation → paused seek to the start; pill drags → keyframe previews
+        self._ctrl = self.player.controller
+        self._scrub = _ScrubDispatcher(self._ctrl, self)
+        self._last_preview_t: float | None = None
+        # Queued: seeks/previews run after the emitting mouse handler returns, never inside it.
+        # All pill signals share the connection type so started → dragging → finished keep their order.
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        np.groupActivated.connect(self._on_group_activated, queued)
+        np.noteActivated.connect(self._on_note_activated, queued)
+        np.notePillDragStarted.connect(self._on_pill_drag_started, queued)
+        np.notePillDragging.connect(self._on_pill_dragging, queued)
+        np.notePillDragFinished.connect(self._on_pill_drag_finished, queued)
 
         # After wiring is in place, perform dev-mode seeding (auto-open + layers/notes)
+        self._devStartupMediaFound.connect(self._open_dev_startup_media)
         try:
             self._dev_seed_from_config()
         except Exception:
@@ -143,16 +175,58 @@ class MainWindow(QtWidgets.QMainWindow):
             pass
 
 
+    @QtCore.Slot(object, float)
+    def _on_frame_time(self, _rgb, pts: float) -> None:
+        self._notes_panel.set_current_time(pts)
+
+    # Timeline → playback slots (bound methods: no per-window closures, no per-call try blocks)
+    def _on_group_activated(self, layer_id: str, start_s: float, end_s: float) -> None:
+        self.player.pause()
+        self._ctrl.seek_to_time(float(start_s))
+
+    def _on_note_activated(self, note_id: str, start_s: float, end_s: float, layer_id: str) -> None:
+        self.player.pause()
+        self._ctrl.seek_to_time(float(start_s))
+
+    def _on_pill_drag_started(self, note_id: str, s: float, e: float) -> None:
+        self._last_preview_t = None
+        self.player.pause()
+
+    def _on_pill_dragging(self, note_id: str, s: float, e: float, preview_t: float) -> None:
+        t = float(preview_t)
+        last = self._last_preview_t
+        self._last_preview_t = t
+        # Snap to the keyframe trailing the drag direction (at/before when moving right,
+        # at/after when moving left): one decode per GOP instead of per update.
+        ctrl = self._ctrl
+        direction = -1 if last is None or t >= last else 1
+        snapped = ctrl.snap_to_keyframe(t, direction)
+        # Non-blocking and coalesced twice: the dispatcher forwards one target per event-loop turn,
+        # and the backend keeps only the latest pending target and decodes it when free.
+        self._scrub.post(t if snapped is None else snapped)
+
+    def _on_pill_drag_finished(self, note_id: str, s: float, e: float, commit: bool) -> None:
+        self._scrub.cancel()
+        self._ctrl.seek_to_time(0.5 * (float(s) + float(e)))
+
     def _restore_state(self):
-        # Example: restore window geometry
+        # Example: restore window geometry (stays synchronous: it must land before the first show)
         g = self.settings.get("ui/main_geometry")
         if isinstance(g, QtCore.QByteArray):
             self.restoreGeometry(g)
 
     def closeEvent(self, e: QtGui.QCloseEvent) -> None:
-        self.settings.set("ui/main_geometry", self.saveGeometry())
+        # Cache update only; disk I/O happens on a pool worker (the aboutToQuit flush() waits on it)
+        self.settings.set("ui/main_geometry", self.saveGeometry(), persist=False)
+        self.settings.flush_async()
         return super().closeEvent(e)
 
+    def _open_dev_startup_media(self, path: str) -> None:
+        try:
+            self.player.open(path)
+        except Exception:
+            pass
+
     def _dev_seed_from_config(self) -> None:
         """
         Dev seeding and auto-open controlled by app_config:
@@ -165,13 +239,16 @@ class MainWindow(QtWidgets.QMainWindow):
         if not DEV_MODE:
             return
 
-        # 1) Auto-open video if configured and exists
+        # 1) Auto-open video if configured and exists; the stat runs on a pool thread (slow mounts)
         mov = (DEV_STARTUP_MOV or "").strip()
-        if mov and os.path.isabs(mov) and os.path.exists(mov):
-            try:
-                self.player.open(mov)
-            except Exception:
-                pass
+        if mov and os.path.isabs(mov):
+            def _probe() -> None:
+                if os.path.exists(mov):
+                    try:
+                        self._devStartupMediaFound.emit(mov)  # queued onto the UI thread
+                    except RuntimeError:
+                        pass  # window already gone
+            QtCore.QThreadPool.globalInstance().start(_probe)
 
         # 2) Seed layers/notes if provided
         try:
@@ -183,36 +260,40 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
 
             from crittr.ui.timeline.notes_tree import Layer, Note  # reuse existing types
-            for L in DEV_LAYER:
-                # Extract layer fields with reasonable defaults
-                lid = str(L.get("id") or "").strip()
-                lname = str(L.get("name") or "Layer").strip()
-                color_hex = str(L.get("color") or "#8ab4f8").strip()
-                qcolor = QtGui.QColor(color_hex) if QtGui.QColor(color_hex).isValid() else QtGui.QColor("#8ab4f8")
-
-                notes_spec = L.get("notes") or []
-
-                # If layer id is provided, construct Layer explicitly so we preserve the id
-                if lid:
-                    layer_obj = Layer(lid, lname, True, False, qcolor)
-                    # Build Note objects bound to this layer id
-                    notes_objs = []
-                    for nd in notes_spec:
-                        nid = str(nd.get("id") or tree.alloc_note_id())
-                        s = float(nd.get("start_s") or 0.0)
-                        e = float(nd.get("end_s") or max(0.0, s + 2.0))
-                        txt = str(nd.get("text") or "")
-                        notes_objs.append(Note(nid, lid, s, e, txt))
-                    tree.add_layer(layer_obj, notes_objs)
-                else:
-                    # No explicit id → let tree allocate, then add notes individually
-                    new_lid = tree.add_layer_simple(lname, qcolor)
-                    for nd in notes_spec:
-                        nid = str(nd.get("id") or tree.alloc_note_id())
-                        s = float(nd.get("start_s") or 0.0)
-                        e = float(nd.get("end_s") or max(0.0, s + 2.0))
-                        txt = str(nd.get("text") or "")
-                        tree.add_note(new_lid, Note(nid, new_lid, s, e, txt))
+
+            def _notes(spec, layer_id: str) -> list:
+                out = []
+                for nd in spec:
+                    nid = str(nd.get("id") or tree.alloc_note_id())
+                    s = float(nd.get("start_s") or 0.0)
+                    e = float(nd.get("end_s") or max(0.0, s + 2.0))
+                    out.append(Note(nid, layer_id, s, e, str(nd.get("text") or "")))
+                return out
+
+            # Shared fallback; layers replace their color on edit rather than mutating it
+            default_color = QtGui.QColor("#8ab4f8")
+
+            # One add_layer() per layer (notes included) and a single repaint for the whole seed
+            tree.setUpdatesEnabled(False)
+            try:
+                for L in DEV_LAYER:
+                    # Extract layer fields with reasonable defaults
+                    lid = str(L.get("id") or "").strip()
+                    lname = str(L.get("name") or "Layer").strip()
+                    qcolor = QtGui.QColor(str(L.get("color") or "").strip())
+                    if not qcolor.isValid():
+                        qcolor = default_color
+
+                    notes_spec = L.get("notes") or []
+
+                    if lid:
+                        # Explicit id: construct Layer directly so we preserve it
+                        tree.add_layer(Layer(lid, lname, True, False, qcolor), _notes(notes_spec, lid))
+                    else:
+                        # No explicit id → tree allocates one and rebinds the notes to it
+                        tree.add_layer_simple(lname, qcolor, _notes(notes_spec, ""))
+            finally:
+                tree.setUpdatesEnabled(True)
         except Exception:
             pass
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
+from bisect import bisect_left
 from typing import List, Optional
+import numpy as np
 from crittr.qt import QtCore, QtGui, QtWidgets
 from crittr.ui.theme import Theme
 
@@ -14,55 +16,108 @@ class MarkerSlider(QtWidgets.QSlider):
     def __init__(self, orientation: QtCore.Qt.Orientation, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(orientation, parent)
         self._markers: List[int] = []
+        # Geometry caches; dropped on resize/style/range changes (see _invalidate_geometry)
+        self._groove: Optional[QtCore.QRect] = None
+        self._lines: Optional[List[QtCore.QLine]] = None
+        self._overlay: Optional[QtGui.QPixmap] = None  # ticks pre-rendered once, blitted per paint
         self.setMouseTracking(True)
         self.setMinimum(0)
         self.setMaximum(100)  # will be adjusted dynamically
 
     def set_markers(self, frames: List[int]) -> None:
         self._markers = sorted(set(int(f) for f in frames if f >= 0))
+        self._lines = None
+        self._overlay = None
         self.update()
 
+    def _invalidate_geometry(self) -> None:
+        self._groove = None
+        self._lines = None
+        self._overlay = None
+
+    def _groove_rect(self) -> QtCore.QRect:
+        g = self._groove
+        if g is None:
+            opt = QtWidgets.QStyleOptionSlider()
+            self.initStyleOption(opt)
+            g = self.style().subControlRect(
+                QtWidgets.QStyle.ComplexControl.CC_Slider, opt,
+                QtWidgets.QStyle.SubControl.SC_SliderGroove, self,
+            )
+            self._groove = g
+        return g
+
+    def _marker_lines(self) -> List[QtCore.QLine]:
+        lines = self._lines
+        if lines is None:
+            groove = self._groove_rect()
+            span = max(1, self.maximum() - self.minimum())
+            # Integer pixel positions for all markers at once
+            frames = np.asarray(self._markers, dtype=np.int64)
+            xs = groove.left() + ((frames - self.minimum()) * groove.width()) // span
+            y1 = groove.center().y() - 6
+            y2 = groove.center().y() + 6
+            lines = [QtCore.QLine(x, y1, x, y2) for x in xs.tolist()]
+            self._lines = lines
+        return lines
+
+    def _marker_overlay(self) -> QtGui.QPixmap:
+        pm = self._overlay
+        if pm is None:
+            dpr = self.devicePixelRatioF()
+            pm = QtGui.QPixmap(self.size() * dpr)
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(QtCore.Qt.GlobalColor.transparent)
+            p = QtGui.QPainter(pm)
+            p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            # Draw markers as small green ticks, in one call
+            p.setPen(QtGui.QPen(Theme.success, 2))
+            p.drawLines(self._marker_lines())
+            p.end()
+            self._overlay = pm
+        return pm
+
+    def resizeEvent(self, e: QtGui.QResizeEvent) -> None:
+        self._invalidate_geometry()
+        super().resizeEvent(e)
+
+    def showEvent(self, e: QtGui.QShowEvent) -> None:
+        self._invalidate_geometry()
+        super().showEvent(e)
+
+    def changeEvent(self, e: QtCore.QEvent) -> None:
+        if e.type() in (QtCore.QEvent.Type.StyleChange, QtCore.QEvent.Type.PaletteChange,
+                        QtCore.QEvent.Type.DevicePixelRatioChange):
+            self._invalidate_geometry()
+        super().changeEvent(e)
+
+    def sliderChange(self, change: QtWidgets.QAbstractSlider.SliderChange) -> None:
+        if change in (QtWidgets.QAbstractSlider.SliderChange.SliderRangeChange,
+                      QtWidgets.QAbstractSlider.SliderChange.SliderOrientationChange):
+            self._invalidate_geometry()
+        super().sliderChange(change)
+
     def paintEvent(self, e: QtGui.QPaintEvent) -> None:
         super().paintEvent(e)
         if not self._markers:
             return
         p = QtGui.QPainter(self)
-        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
-
-        opt = QtWidgets.QStyleOptionSlider()
-        self.initStyleOption(opt)
-        groove_rect = self.style().subControlRect(
-            QtWidgets.QStyle.ComplexControl.CC_Slider, opt,
-            QtWidgets.QStyle.SubControl.SC_SliderGroove, self,
-        )
-        # Draw markers as small green ticks
-        p.setPen(QtGui.QPen(Theme.success, 2))
-        span = max(1, self.maximum() - self.minimum())
-        for f in self._markers:
-            ratio = (f - self.minimum()) / span
-            x = int(groove_rect.left() + ratio * groove_rect.width())
-            y1 = groove_rect.center().y() - 6
-            y2 = groove_rect.center().y() + 6
-            p.drawLine(x, y1, x, y2)
+        p.drawPixmap(0, 0, self._marker_overlay())
         p.end()
 
     def mousePressEvent(self, e: QtGui.QMouseEvent) -> None:
         if e.button() == QtCore.Qt.MouseButton.LeftButton:
             # Jump to position and see if close to a marker
             val = self._pixel_pos_to_value(e.position().x())
-            self.setValue(val)
+            if val != self.value():
+                self.setValue(val)
             hit = self._nearest_marker(val)
             if hit is not None and abs(hit - val) <= max(1, int(0.01 * (self.maximum() - self.minimum()))):
                 self.markerClicked.emit(hit)
         super().mousePressEvent(e)
 
     def _pixel_pos_to_value(self, px: float) -> int:
-        opt = QtWidgets.QStyleOptionSlider()
-        self.initStyleOption(opt)
-        groove = self.style().subControlRect(
-            QtWidgets.QStyle.ComplexControl.CC_Slider, opt,
-            QtWidgets.QStyle.SubControl.SC_SliderGroove, self,
-        )
+        groove = self._groove_rect()
         if groove.width() <= 0:
             return self.value()
         ratio = (px - groove.left()) / groove.width()
@@ -70,6 +125,13 @@ class MarkerSlider(QtWidgets.QSlider):
         return int(self.minimum() + ratio * (self.maximum() - self.minimum()))
 
     def _nearest_marker(self, value: int) -> Optional[int]:
-        if not self._markers:
+        markers = self._markers  # sorted by set_markers()
+        if not markers:
             return None
-        return min(self._markers, key=lambda m: abs(m - value))
+        i = bisect_left(markers, value)
+        if i == 0:
+            return markers[0]
+        if i == len(markers):
+            return markers[-1]
+        before, after = markers[i - 1], markers[i]
+        return before if value - before <= after - value else after
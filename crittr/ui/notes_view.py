@@ -1,14 +1,18 @@
 from __future__ import annotations
-from typing import Dict, List
+from bisect import bisect_right
+from typing import Dict, List, Tuple
 from crittr.qt import QtCore, QtWidgets
 
+_ROW_TEXT = "#{:06d}  •  {}".format
+
 class NotesPanel(QtWidgets.QWidget):
     notePosted = QtCore.Signal(int, str)     # frame, text
     noteActivated = QtCore.Signal(int)       # frame
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
-        self._notes: Dict[int, List[str]] = {}
+        self._notes: Dict[int, List[Tuple[str, str]]] = {}   # frame -> [(text, row label)]
+        self._row_frames: List[int] = []   # frame of each list row, kept sorted (bisect)
         self._build()
 
     def _build(self):
@@ -26,16 +30,24 @@ class NotesPanel(QtWidgets.QWidget):
         layout.addWidget(self.list, 1)
 
         self.post_btn.clicked.connect(self._post)
-        self.list.itemActivated.connect(self._jump)
+        # One signal only: itemActivated also fires on (double-)click, which seeked twice per click
         self.list.itemClicked.connect(self._jump)
 
     def set_notes(self, notes: Dict[int, List[str]]) -> None:
-        self._notes = {int(k): list(v) for k, v in (notes or {}).items()}
+        self._notes = {}
+        for k, v in (notes or {}).items():
+            f = int(k)
+            self._notes[f] = [(txt, _ROW_TEXT(f, txt)) for txt in v]
         self._refresh()
 
     def add_note(self, frame: int, text: str) -> None:
-        self._notes.setdefault(int(frame), []).append(text)
-        self._refresh()
+        f = int(frame)
+        label = _ROW_TEXT(f, text)  # formatted once, reused by _refresh()
+        self._notes.setdefault(f, []).append((text, label))
+        # Insert one row after any existing notes on the same frame instead of rebuilding the list
+        row = bisect_right(self._row_frames, f)
+        self._row_frames.insert(row, f)
+        self.list.insertItem(row, self._make_item(f, label))
 
     def _post(self):
         text = self.note_edit.text().strip()
@@ -49,10 +61,22 @@ class NotesPanel(QtWidgets.QWidget):
         f = int(item.data(QtCore.Qt.ItemDataRole.UserRole))
         self.noteActivated.emit(f)
 
+    @staticmethod
+    def _make_item(f: int, label: str) -> QtWidgets.QListWidgetItem:
+        it = QtWidgets.QListWidgetItem(label)
+        it.setData(QtCore.Qt.ItemDataRole.UserRole, f)
+        return it
+
     def _refresh(self):
-        self.list.clear()
-        for f in sorted(self._notes.keys()):
-            for txt in self._notes[f]:
-                it = QtWidgets.QListWidgetItem(f"#{f:06d}  •  {txt}")
-                it.setData(QtCore.Qt.ItemDataRole.UserRole, f)
-                self.list.addItem(it)
+        # Bulk rebuild (set_notes): repaint once at the end rather than per added row
+        lst = self.list
+        lst.setUpdatesEnabled(False)
+        try:
+            lst.clear()
+            self._row_frames = []
+            for f in sorted(self._notes.keys()):
+                for _txt, label in self._notes[f]:
+                    lst.addItem(self._make_item(f, label))
+                    self._row_frames.append(f)
+        finally:
+            lst.setUpdatesEnabled(True)
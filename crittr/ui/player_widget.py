@@ -8,6 +8,7 @@ from crittr.ui.frame_view import FrameView
 from crittr.ui.marker_slider import MarkerSlider
 from crittr.core.logging import get_logger
 import math
+import time
 from crittr.core.media_controller import MediaController, pts_to_ms, ms_to_pts, frame_of
 
 class PlayerWidget(QtWidgets.QWidget):
@@ -23,7 +24,7 @@ class PlayerWidget(QtWidgets.QWidget):
     mediaEnded = QtCore.Signal()
     playStateChanged = QtCore.Signal(bool)        # True if playing
     frameChanged = QtCore.Signal(int)             # current frame index (approx for now)
-    timecodeChanged = QtCore.Signal(str)          # "HH:MM:SS.mmm"
+    timecodeChanged = QtCore.Signal(str)          # "HH:MM:SS.mmm", once per new whole second
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
@@ -37,29 +38,57 @@ class PlayerWidget(QtWidgets.QWidget):
         self._fps_est: float = 24.0
         self._duration_known: bool = False  # UI-side guard
         self._duration_s: float = 0.0
-        self._display_timer = QtCore.QElapsedTimer()
-        self._display_timer.start()
-        self._display_min_interval_ms = 1000 // 30  # ~30 FPS UI refresh
+        self._duration_ms: int = 0  # pts_to_ms(_duration_s), the slider maximum once known
+        # Step size memo: 1 / fps_est, recomputed only when the estimate moved (see _frame_sec)
+        self._step_fps: float = 0.0
+        self._step_s: float = 1.0 / 24.0
+        # Label cache: "HH:MM:SS." is re-formatted only when the whole second changes
+        self._last_second: int = -1
+        self._last_frame_idx: int = -1
+        self._last_time_text: str = ""
+        self._time_prefix: str = "00:00:00."
+        # frame_of() memo: labels and frameChanged ask for the same (pts, fps) on every frame
+        self._fidx_pts: float = -1.0
+        self._fidx_fps: float = -1.0
+        self._fidx: int = 0
+        # Playback frames are shown at most once per display refresh (see _update_display_interval);
+        # _proc_ns is the smoothed cost of showing one, so the budget accounts for our own work.
+        # Plain monotonic_ns() ints: no Qt timer calls on the per-frame path.
+        self._display_interval_ns: int = 1_000_000_000 // 30
+        self._proc_ns: float = 0.0
+        self._next_paint_ns: int = 0
+        # While playing, only the image and labels update per frame; slider position and frameChanged
+        # observers are refreshed by this timer (at most every 50 ms) and on pause/end
+        self._finalize_timer = QtCore.QTimer(self)
+        self._finalize_timer.setSingleShot(True)
+        self._finalize_timer.setInterval(50)
+        self._finalize_timer.timeout.connect(self._finalize_frame_state)
+        self._screen_hooked = False
 
         # View
         self.frame_view = FrameView(self)
+        self.frame_view.frameShown.connect(self.controller.hold_frame)
 
-        # Transport
+        # Transport (play/pause icons are swapped on every state change; look them up once)
+        st = self.style()
+        sp = QtWidgets.QStyle.StandardPixmap
+        self._icon_play = st.standardIcon(sp.SP_MediaPlay)
+        self._icon_pause = st.standardIcon(sp.SP_MediaPause)
         self.play_btn = QtWidgets.QToolButton(text="")
-        self.play_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay))
+        self.play_btn.setIcon(self._icon_play)
         # Go to start/end
         self.prev_btn = QtWidgets.QToolButton()
-        self.prev_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaSkipBackward))
+        self.prev_btn.setIcon(st.standardIcon(sp.SP_MediaSkipBackward))
         self.prev_btn.setToolTip("Go to start")
         self.next_btn = QtWidgets.QToolButton()
-        self.next_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaSkipForward))
+        self.next_btn.setIcon(st.standardIcon(sp.SP_MediaSkipForward))
         self.next_btn.setToolTip("Go to end")
         # Step one frame backward/forward
         self.step_back_btn = QtWidgets.QToolButton()
-        self.step_back_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaSeekBackward))
+        self.step_back_btn.setIcon(st.standardIcon(sp.SP_MediaSeekBackward))
         self.step_back_btn.setToolTip("Step back 1 frame")
         self.step_fwd_btn = QtWidgets.QToolButton()
-        self.step_fwd_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaSeekForward))
+        self.step_fwd_btn.setIcon(st.standardIcon(sp.SP_MediaSeekForward))
         self.step_fwd_btn.setToolTip("Step forward 1 frame")
 
         self.rate_combo = QtWidgets.QComboBox()
@@ -78,6 +107,16 @@ class PlayerWidget(QtWidgets.QWidget):
         self.timeline.sliderPressed.connect(self._on_slider_pressed)
         self.timeline.sliderReleased.connect(self._on_slider_released)
         self._is_scrubbing = False
+        # Scrub previews: valueChanged ticks only record the target; one flush per event-loop turn sends it
+        self._pending_preview_pts: Optional[float] = None
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(0)
+        self._preview_timer.timeout.connect(self._flush_preview)
+        # Scrub direction and the keyframe last sent, so moves inside one GOP decode nothing
+        self._last_slider_value = 0
+        self._last_preview_kf: Optional[float] = None
+        self._shown_thumb: Optional[np.ndarray] = None  # scrub thumbnail currently on screen
 
         # Layout
         transport = QtWidgets.QHBoxLayout()
@@ -111,8 +150,8 @@ class PlayerWidget(QtWidgets.QWidget):
         self.play_btn.clicked.connect(self._toggle_play)
         self.prev_btn.clicked.connect(self._goto_start)
         self.next_btn.clicked.connect(self._goto_end)
-        self.step_back_btn.clicked.connect(lambda: self._step_frame(-1))
-        self.step_fwd_btn.clicked.connect(lambda: self._step_frame(1))
+        self.step_back_btn.clicked.connect(self._step_back)
+        self.step_fwd_btn.clicked.connect(self._step_fwd)
         self.rate_combo.currentTextChanged.connect(self._change_rate)
         # Controller signals → UI
         self.controller.frameReady.connect(self._on_frame_ready)
@@ -127,15 +166,15 @@ class PlayerWidget(QtWidgets.QWidget):
         """Open media file. Starts paused; caller can press play()."""
         self._log.info("PlayerWidget.open(%s)", path)
         # Reset view state
-        self.is_playing = False
+        self._finalize_timer.stop()
+        self._set_playing(False)
         self.current_frame = 0
         self._last_pts = 0.0
         self._fps_est = 24.0
         self._duration_s = 0.0
+        self._duration_ms = 0
         self._duration_known = False
-        self.timeline.blockSignals(True)
-        self.timeline.setValue(0)
-        self.timeline.blockSignals(False)
+        self._set_slider_quietly(0)
         self.timeline.setMaximum(0)  # will be set when duration is known
         self._update_time_labels()
         # Delegate to controller (emits durationChanged if known, may also emit a poster frame)
@@ -149,9 +188,8 @@ class PlayerWidget(QtWidgets.QWidget):
             self._log.info("play() ignored: is_playing=%s", self.is_playing)
             return
         self.controller.play()
-        self.is_playing = True
-        self.play_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPause))
-        self.playStateChanged.emit(True)
+        self.frame_view.set_smooth(False)
+        self._set_playing(True)
 
     def pause(self) -> None:
         self._log.info("pause() pressed")
@@ -159,10 +197,18 @@ class PlayerWidget(QtWidgets.QWidget):
             self._log.info("pause() ignored: is_playing=%s", self.is_playing)
             return
         self.controller.pause()
-        self.is_playing = False
-        self.play_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay))
-        self.playStateChanged.emit(False)
-
+        if self._finalize_timer.isActive():
+            self._finalize_frame_state()  # observers see the paused frame right away
+        self.frame_view.set_smooth(True)
+        self._set_playing(False)
+
+    def _set_playing(self, flag: bool) -> None:
+        """Single place that flips the play state: transport icon and playStateChanged follow it."""
+        if flag == self.is_playing:
+            return
+        self.is_playing = flag
+        self.play_btn.setIcon(self._icon_pause if flag else self._icon_play)
+        self.playStateChanged.emit(flag)
 
     def _toggle_play(self) -> None:
         if self.is_playing:
@@ -185,26 +231,67 @@ class PlayerWidget(QtWidgets.QWidget):
         # Otherwise set the slider; this will invoke _on_slider_changed via the signal
         self.timeline.setValue(frame_index)
 
+    def showEvent(self, e: QtGui.QShowEvent) -> None:
+        super().showEvent(e)
+        if not self._screen_hooked:
+            handle = self.window().windowHandle()
+            if handle is not None:
+                handle.screenChanged.connect(self._update_display_interval)
+                self._screen_hooked = True
+            self._update_display_interval(self.screen())
+
+    @QtCore.Slot(object)
+    def _update_display_interval(self, screen: Optional[QtGui.QScreen] = None) -> None:
+        """Throttle playback painting to the refresh period of the screen we are on (>= 30 Hz)."""
+        hz = screen.refreshRate() if screen is not None else 0.0
+        self._display_interval_ns = int(1e9 / max(30.0, float(hz or 60.0)))
+
     @QtCore.Slot(object, float)
     def _on_frame_ready(self, rgb, pts_s: float) -> None:
-        # Basic UI throttling to avoid overpainting
-        if self._display_timer.elapsed() < self._display_min_interval_ms:
-            return
-        self._display_timer.restart()
+        # Playback: skip frames that would land inside the current display refresh.
+        # Seek/preview/poster frames are one-offs and always shown.
+        t0 = time.monotonic_ns()
+        if self.controller.is_playing:
+            if t0 < self._next_paint_ns:
+                return
+            self._next_paint_ns = t0 + self._display_interval_ns - int(self._proc_ns)
         # Paint and derived frame index for listeners
         try:
             self.frame_view.set_frame(rgb)
         except Exception as ex:
             self._log.error("Error updating FrameView: %s", ex)
+        if self._is_scrubbing:
+            # Drag previews are keyframe-snapped: show the image, but labels and listeners stay on
+            # the time under the cursor (_last_pts, set by _on_slider_changed)
+            self.current_frame = self._frame_idx(self._last_pts)
+            self.frameChanged.emit(self.current_frame)
+            return
         self._fps_est = self.controller.fps_est
         self._last_pts = float(pts_s)
         self._update_time_labels_from_pts(self._last_pts)
-        self.current_frame = frame_of(self._last_pts, self._fps_est)
+        if self.controller.is_playing:
+            # Playback frames come without timeChanged; the slider is synced by the deferred pass
+            if not self._finalize_timer.isActive():
+                self._finalize_timer.start()
+        else:
+            self.current_frame = self._frame_idx(self._last_pts)
+            self.frameChanged.emit(self.current_frame)
+        self._proc_ns = 0.9 * self._proc_ns + 0.1 * (time.monotonic_ns() - t0)  # EMA
+
+    @QtCore.Slot()
+    def _finalize_frame_state(self) -> None:
+        """Deferred part of playback frames: slider position and frameChanged for the latest one."""
+        self._finalize_timer.stop()
+        self._on_time_changed(self._last_pts, exact=not self.controller.is_playing)
+        self.current_frame = self._frame_idx(self._last_pts)
         self.frameChanged.emit(self.current_frame)
 
     @QtCore.Slot(float)
-    def _on_time_changed(self, pts_s: float) -> None:
-        """Keep the slider in sync with canonical time (ms)."""
+    def _on_time_changed(self, pts_s: float, exact: bool = True) -> None:
+        """
+        Keep the slider in sync with canonical time (ms). exact=False (playback frames) skips the
+        write while the handle would stay on the same pixel; each setValue() repaints the slider.
+        """
         # If the user is scrubbing, ignore external time updates to prevent bounce-back.
         if getattr(self, "_is_scrubbing", False):
             return
@@ -212,21 +299,36 @@ class PlayerWidget(QtWidgets.QWidget):
         # Auto-grow only while duration is unknown
         if not self._duration_known and v > self.timeline.maximum():
             self.timeline.setMaximum(v + 2000)  # small cushion
-        if self.timeline.value() != v:
-            self.timeline.blockSignals(True)
-            self.timeline.setValue(v)
-            self.timeline.blockSignals(False)
+        tl = self.timeline
+        cur = tl.value()
+        if cur == v:
+            return
+        if not exact:
+            lo, hi, span = tl.minimum(), tl.maximum(), tl.width()
+            pos = QtWidgets.QStyle.sliderPositionFromValue
+            if pos(lo, hi, v, span) == pos(lo, hi, cur, span):
+                return
+        self._set_slider_quietly(v)
+
+    def _set_slider_quietly(self, v: int) -> None:
+        """Move the slider without re-entering _on_slider_changed (restores any prior blocked state)."""
+        blocker = QtCore.QSignalBlocker(self.timeline)
+        self.timeline.setValue(v)
+        blocker.unblock()
 
     @QtCore.Slot(float)
     def _on_duration_changed(self, duration_s: float) -> None:
         self._duration_s = max(0.0, float(duration_s))
         self._duration_known = True
-        self.timeline.setMaximum(pts_to_ms(self._duration_s))
+        self._duration_ms = pts_to_ms(self._duration_s)
+        self.timeline.setMaximum(self._duration_ms)
 
     def _on_ended(self) -> None:
         self._log.debug("_on_ended: playback ended")
-        self.is_playing = False
-        self.play_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay))
+        if self._finalize_timer.isActive():
+            self._finalize_frame_state()
+        self.frame_view.set_smooth(True)
+        self._set_playing(False)
         self.mediaEnded.emit()
 
     # ──────────────────────────────────────────────────────────────────────────
@@ -242,13 +344,11 @@ class PlayerWidget(QtWidgets.QWidget):
             self._last_pts = got[1]
             self._update_time_labels_from_pts(self._last_pts)
             # ensure UI reflects paused state
-            self.is_playing = False
-            self.play_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay))
-            self.playStateChanged.emit(False)
+            self._set_playing(False)
 
-    def preview(self, seconds: float) -> None:
+    def preview(self, seconds: float, exact: bool = False) -> None:
         """Fast preview frame for scrubbing; does not change play state."""
-        rgb = self.controller.preview_frame_at(float(seconds))
+        rgb = self.controller.preview_frame_at(float(seconds), exact=exact)
         if rgb is not None:
             self._last_pts = float(seconds)
             self._update_time_labels_from_pts(self._last_pts)
@@ -262,34 +362,69 @@ class PlayerWidget(QtWidgets.QWidget):
         # Slider is time-based (milliseconds). Convert to seconds for seeking/preview.
         pts_s = ms_to_pts(value)
         if self._is_scrubbing:
-            rgb = self.controller.preview_frame_at(pts_s)
-            if rgb is not None:
+            # Dragging: queue a keyframe preview (coalesced off the UI thread); the exact frame is decoded on release.
+            # Snap to the keyframe trailing the drag (at/before moving right, at/after moving left).
+            direction = -1 if value >= self._last_slider_value else 1
+            self._last_slider_value = value
+            thumb = self.controller.thumbnail_at(pts_s)
+            if thumb is not None:
+                # Resident low-res thumbnail: no decoder round-trip at all mid-drag
+                if self._last_preview_kf is not None:
+                    self._last_preview_kf = None
+                    self._pending_preview_pts = None
+                    self.controller.cancel_previews()  # a late full-res preview would jump back
+                if thumb is not self._shown_thumb:
+                    self._shown_thumb = thumb
+                    self.frame_view.set_preview(thumb)
                 self._last_pts = pts_s
                 self._update_time_labels_from_pts(self._last_pts)
+                return
+            kf = self.controller.snap_to_keyframe(pts_s, direction)
+            if kf is None or kf != self._last_preview_kf:
+                self._last_preview_kf = kf
+                self._pending_preview_pts = pts_s if kf is None else kf
+                if not self._preview_timer.isActive():
+                    self._preview_timer.start()
+            self._last_pts = pts_s
+            self._update_time_labels_from_pts(self._last_pts)
             return
-        # Not scrubbing → precise seek, remain paused
-        got = self.controller.seek_to_time(pts_s)
+        # Not scrubbing → precise seek, remain paused; a nudge of a frame or two forward is stepped
+        # instead (cache or forward decode, no decoder flush)
+        frame_sec = self._frame_sec()
+        if 0.0 < pts_s - self._last_pts <= 2.0 * frame_sec:
+            got = self.controller.step_to_time(pts_s, frame_sec)
+        else:
+            got = self.controller.seek_to_time(pts_s)
         if got is not None:
             # controller emits frameReady/timeChanged; just mirror state here
             self._last_pts = got[1]
             self._update_time_labels_from_pts(self._last_pts)
-            self.is_playing = False
-            self.play_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay))
-            self.playStateChanged.emit(False)
+            self._set_playing(False)
         # Emit frame index for listeners
-        self.current_frame = frame_of(self._last_pts, max(1e-6, self._fps_est))
+        self.current_frame = self._frame_idx(self._last_pts)
         self.frameChanged.emit(self.current_frame)
 
+    def _flush_preview(self) -> None:
+        pts_s, self._pending_preview_pts = self._pending_preview_pts, None
+        if pts_s is not None and self._is_scrubbing:
+            self.controller.request_preview(pts_s, exact=False)
+
     def _on_slider_pressed(self) -> None:
         self._log.debug("Slider pressed: begin scrubbing")
         self._is_scrubbing = True
+        self._last_slider_value = self.timeline.value()
+        self._last_preview_kf = None
+        self._shown_thumb = None
         # Pause playback while scrubbing for responsiveness
         if self.is_playing:
             self.pause()
+        self.frame_view.set_smooth(False)
 
     def _on_slider_released(self) -> None:
         self._log.debug("Slider released: commit seek")
         # Keep scrubbing ON during commit to block any stale timeChanged from reverting the slider.
+        self._preview_timer.stop()
+        self._pending_preview_pts = None
         try:
             # Commit final seek to backend at the slider's current time
             val = self.timeline.value()
@@ -300,13 +435,17 @@ class PlayerWidget(QtWidgets.QWidget):
                 self._last_pts = pts
                 self.frame_view.set_frame(arr)
                 self._update_time_labels_from_pts(pts)
+                # The seek's own frameReady arrived while still scrubbing (slider time); report the exact frame
+                fidx = self._frame_idx(pts)
+                if fidx != self.current_frame:
+                    self.current_frame = fidx
+                    self.frameChanged.emit(fidx)
                 # Leave paused after scrubbing; user can hit play
-                self.is_playing = False
-                self.play_btn.setIcon(self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_MediaPlay))
-                self.playStateChanged.emit(False)
+                self._set_playing(False)
         finally:
             # Only now consider scrubbing finished so subsequent timeChanged can sync UI.
             self._is_scrubbing = False
+            self.frame_view.set_smooth(not self.is_playing)
 
 
     def _goto_start(self) -> None:
@@ -321,6 +460,14 @@ class PlayerWidget(QtWidgets.QWidget):
             return
         self.timeline.setValue(self.timeline.maximum())
 
+    @QtCore.Slot()
+    def _step_back(self) -> None:
+        self._step_frame(-1)
+
+    @QtCore.Slot()
+    def _step_fwd(self) -> None:
+        self._step_frame(1)
+
     def _step_frame(self, direction: int) -> None:
         """
         Step exactly one frame backward/forward relative to current time.
@@ -328,18 +475,21 @@ class PlayerWidget(QtWidgets.QWidget):
         """
         if not self.timeline:
             return
-        # Determine effective fps; fall back to a sane default if estimate is unset
-        fps = float(self.controller.fps_est) if self.controller.fps_est and self.controller.fps_est > 0.1 else 24.0
-        frame_sec = 1.0 / fps
-        # Current time from last PTS
-        cur_sec = max(0.0, float(self._last_pts))
-        # Compute target time and clamp to [0, duration]
-        duration_sec = self._duration_s if self._duration_known else max(0.0, self.timeline.maximum() / 1000.0)
-        target_sec = cur_sec + (frame_sec * (1 if direction >= 0 else -1))
-        target_sec = min(max(0.0, target_sec), duration_sec)
-        # Set the slider (ms); normal seek path will update the image
-        target_ms = pts_to_ms(target_sec)
-        self.timeline.setValue(target_ms)
+        frame_sec = self._frame_sec()
+        # Target one frame away from the last PTS, clamped to [0, duration]
+        target_sec = self._last_pts + frame_sec if direction >= 0 else self._last_pts - frame_sec
+        end_ms = self._duration_ms if self._duration_known else self.timeline.maximum()
+        target_sec = min(max(0.0, target_sec), ms_to_pts(end_ms))
+        if self.is_playing:
+            self.pause()
+        # Step through the controller (read-ahead cache, else precise seek); it syncs the slider via timeChanged
+        got = self.controller.step_to_time(target_sec, frame_sec)
+        if got is not None:
+            self._last_pts = got[1]
+            self._update_time_labels_from_pts(self._last_pts)
+            self._set_playing(False)
+        self.current_frame = self._frame_idx(self._last_pts)
+        self.frameChanged.emit(self.current_frame)
 
     def _change_rate(self, text: str) -> None:
         # Placeholder: backend rate control not yet exposed; store selection for later.
@@ -350,21 +500,47 @@ class PlayerWidget(QtWidgets.QWidget):
         Update the time and frame labels from the current internal state.
         This is a convenience wrapper used when we don't have a fresh frame yet.
         """
-        pts = getattr(self, "_last_pts", 0.0)
         try:
-            self._update_time_labels_from_pts(float(pts))
+            self._update_time_labels_from_pts(self._last_pts)
         except Exception:
             # Fallback to zeros if something goes wrong
+            self._last_second = self._last_frame_idx = -1
+            self._last_time_text = ""
             self.time_label.setText("00:00:00.000")
             self.frame_label.setText("#000000")
             self.timecodeChanged.emit(self.time_label.text())
 
+    def _frame_sec(self) -> float:
+        """Frame duration from the controller's fps estimate (24 fps while it is unset)."""
+        fps = self.controller.fps_est
+        if fps != self._step_fps:
+            self._step_fps = fps
+            self._step_s = 1.0 / fps if fps and fps > 0.1 else 1.0 / 24.0
+        return self._step_s
+
+    def _frame_idx(self, pts: float) -> int:
+        """frame_of(pts, fps_est), recomputed only when either input changed."""
+        fps = self._fps_est
+        if pts != self._fidx_pts or fps != self._fidx_fps:
+            self._fidx_pts, self._fidx_fps = pts, fps
+            self._fidx = frame_of(pts, fps)  # clamps fps itself
+        return self._fidx
+
     def _update_time_labels_from_pts(self, pts: float) -> None:
         secs = max(0.0, float(pts))
-        msec = int((secs - int(secs)) * 1000)
-        s = int(secs) % 60
-        m = (int(secs) // 60) % 60
-        h = int(secs) // 3600
-        self.time_label.setText(f"{h:02d}:{m:02d}:{s:02d}.{msec:03d}")
-        self.frame_label.setText(f"#{frame_of(secs, max(1e-6, self._fps_est)):06d}")
-        self.timecodeChanged.emit(self.time_label.text())
+        # One integer split: int(secs) and the ms fraction can't disagree just below a whole second
+        isec, msec = divmod(int(secs * 1000.0), 1000)
+        new_second = isec != self._last_second
+        if new_second:
+            self._time_prefix = f"{isec // 3600:02d}:{(isec // 60) % 60:02d}:{isec % 60:02d}."
+        text = self._time_prefix + f"{msec:03d}"
+        if text != self._last_time_text:  # repeats are common right after pause/seek
+            self._last_time_text = text
+            self.time_label.setText(text)
+        fidx = self._frame_idx(secs)
+        if fidx != self._last_frame_idx:
+            self._last_frame_idx = fidx
+            self.frame_label.setText(f"#{fidx:06d}")
+        if new_second:
+            self._last_second = isec
+            self.timecodeChanged.emit(text)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 from typing import Iterable
-from crittr.qt import QtCore, QtWidgets
+import numpy as np
+from crittr.qt import QtCore, QtGui, QtWidgets
+from crittr.core.video import poster_thumbnail
 
 class PlaylistView(QtWidgets.QListWidget):
     itemActivatedPath = QtCore.Signal(str)
+    # (set_paths generation, QPersistentModelIndex, BGR array) from a pool thread; queued to the UI thread
+    _thumbReady = QtCore.Signal(int, object, object)
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
@@ -17,13 +21,53 @@ class PlaylistView(QtWidgets.QListWidget):
         self.setStyleSheet(f"QListWidget {{ background: {Theme.bg.name()}; }}")
         self.itemActivated.connect(self._emit_path)
         self.itemClicked.connect(self._emit_path)
+        self._thumb_gen = 0
+        self._thumbReady.connect(self._apply_thumb, QtCore.Qt.ConnectionType.QueuedConnection)
 
     def set_paths(self, paths: Iterable[str]) -> None:
-        self.clear()
-        for p in paths:
-            it = QtWidgets.QListWidgetItem(p)
-            it.setData(QtCore.Qt.ItemDataRole.UserRole, p)
-            self.addItem(it)
+        paths = list(paths)
+        self._thumb_gen += 1  # thumbnails still decoding for the previous list are dropped
+        role = QtCore.Qt.ItemDataRole.UserRole
+        # One relayout/repaint for the whole batch instead of one per row
+        self.setUpdatesEnabled(False)
+        targets = []
+        try:
+            self.clear()
+            for p in paths:
+                it = QtWidgets.QListWidgetItem(p)
+                it.setData(role, p)
+                self.addItem(it)
+                # Follows the item through later inserts/removals; invalid once it is gone
+                targets.append((QtCore.QPersistentModelIndex(self.indexFromItem(it)), p))
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # Icons are decoded off the UI thread and filled in as they arrive
+        size = self.iconSize()
+        gen = self._thumb_gen
+        pool = QtCore.QThreadPool.globalInstance()
+        for index, p in targets:
+            def _decode(index: QtCore.QPersistentModelIndex = index, p: str = p) -> None:
+                try:
+                    if gen != self._thumb_gen:
+                        return
+                    bgr = poster_thumbnail(p, size.width(), size.height())
+                    if bgr is not None:
+                        self._thumbReady.emit(gen, index, bgr)  # queued onto the UI thread
+                except RuntimeError:
+                    pass  # view already gone
+            pool.start(_decode)
+
+    @QtCore.Slot(int, object, object)
+    def _apply_thumb(self, gen: int, index: QtCore.QPersistentModelIndex, bgr: np.ndarray) -> None:
+        if gen != self._thumb_gen or not index.isValid():
+            return
+        item = self.itemFromIndex(QtCore.QModelIndex(index))
+        if item is None:
+            return
+        h, w, _ = bgr.shape
+        img = QtGui.QImage(bgr.data, w, h, bgr.strides[0], QtGui.QImage.Format.Format_BGR888)
+        item.setIcon(QtGui.QIcon(QtGui.QPixmap.fromImage(img)))  # fromImage copies the pixels
 
     def _emit_path(self, item: QtWidgets.QListWidgetItem):
         self.itemActivatedPath.emit(str(item.data(QtCore.Qt.ItemDataRole.UserRole)))
@@ -22,6 +22,26 @@ _DARK_PRESET_HEX = [
     "#334155",  # slate-700
 ]
 
+# Theme-derived style strings, formatted once per process rather than once per header
+_HEADER_CSS = f"""
+    GroupHeaderWidget {{
+        background-color: {Theme.header_bg.name()};
+    }}
+    GroupHeaderWidget:hover {{
+        background-color: {Theme.header_bg_hover.name()};
+    }}
+    GroupHeaderWidget[active="true"] {{
+        background-color: {Theme.header_bg_active.name()};
+    }}
+    """
+_TITLE_CSS = f"color:{Theme.text.name()}; font-weight:600;"
+_TITLE_EDIT_CSS = (
+    f"QLineEdit {{ background: transparent; border: 1px solid transparent; "
+    f"color:{Theme.text.name()}; font-weight:600; padding:0; }}"
+)
+_ICON_IDLE_HEX = Theme.icon_idle.name()
+_ICON_HOVER_HEX = Theme.icon_hover.name()
+
 
 class ClickLabel(QtWidgets.QLabel):
     clicked = QtCore.Signal()
@@ -65,24 +85,18 @@ class GroupHeaderWidget(QtWidgets.QWidget):
         self._active = False
         self._rename_wired = False
         self._color_menu: Optional[QtWidgets.QMenu] = None
+        # Range strip geometry (rail + group span), kept until resize/range/duration/font change
+        self._rail_rect: Optional[QtCore.QRect] = None
+        self._span_rect: Optional[QtCore.QRect] = None
+        # Translucent band color, rebuilt only when layer.color is replaced
+        self._band_color: Optional[QtGui.QColor] = None
+        self._band_of: Optional[QtGui.QColor] = None
 
         # Allow style sheets to paint the widget background
         self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
 
         # Use the Theme colors you added (camelCase or UPPER, match your Theme)
-        self.setStyleSheet(
-            f"""
-            GroupHeaderWidget {{
-                background-color: {Theme.header_bg.name()};
-            }}
-            GroupHeaderWidget:hover {{
-                background-color: {Theme.header_bg_hover.name()};
-            }}
-            GroupHeaderWidget[active="true"] {{
-                background-color: {Theme.header_bg_active.name()};
-            }}
-            """
-        )
+        self.setStyleSheet(_HEADER_CSS)
 
         self.setMouseTracking(True)
         #self.setAutoFillBackground(False)
@@ -95,14 +109,11 @@ class GroupHeaderWidget(QtWidgets.QWidget):
 
         # Title (clickable) + inline editor stack
         self.title = ClickLabel(layer.name)
-        self.title.setStyleSheet(f"color:{Theme.text.name()}; font-weight:600;")
+        self.title.setStyleSheet(_TITLE_CSS)
 
         self.title_edit = QtWidgets.QLineEdit(layer.name)
         self.title_edit.setFont(self.title.font())
-        self.title_edit.setStyleSheet(
-            f"QLineEdit {{ background: transparent; border: 1px solid transparent; "
-            f"color:{Theme.text.name()}; font-weight:600; padding:0; }}"
-        )
+        self.title_edit.setStyleSheet(_TITLE_EDIT_CSS)
 
         self._title_stack = QtWidgets.QStackedWidget()
         self._title_stack.addWidget(self.title)
@@ -177,12 +188,14 @@ class GroupHeaderWidget(QtWidgets.QWidget):
     # ───────────────────────────────────────────────────────────────────
     def setRange(self, in_s, out_s):
         self.in_s, self.out_s = in_s, out_s
+        self._rail_rect = None
         self.update()
 
     def setDuration(self, duration_s: float) -> None:
         new_d = max(0.001, float(duration_s))
         if abs(new_d - self.duration_s) > 1e-9:
             self.duration_s = new_d
+            self._rail_rect = None
             self.update()
 
     def setName(self, new_name: str):
@@ -195,6 +208,7 @@ class GroupHeaderWidget(QtWidgets.QWidget):
 
     def setColor(self, color: QtGui.QColor):
         self.layer.color = color
+        self._band_of = None
         self.update()
 
     def setActive(self, active: bool) -> None:
@@ -262,7 +276,7 @@ class GroupHeaderWidget(QtWidgets.QWidget):
         self._update_icons(hover=self._hovered)
 
     def _update_icons(self, hover: bool) -> None:
-        col = Theme.icon_hover.name() if hover or self._active else Theme.icon_idle.name()
+        col = _ICON_HOVER_HEX if hover or self._active else _ICON_IDLE_HEX
         try:
             self.eye.setIcon(qta.icon('fa5s.eye' if self.layer.visible else 'fa5s.eye-slash', color=col))
             self.lock.setIcon(qta.icon('fa5s.lock' if self.layer.locked else 'fa5s.lock-open', color=col))
@@ -282,33 +296,52 @@ class GroupHeaderWidget(QtWidgets.QWidget):
     # ───────────────────────────────────────────────────────────────────
     # Paint (background + group range strip)
     # ───────────────────────────────────────────────────────────────────
-    def paintEvent(self, e: QtGui.QPaintEvent) -> None:
-        # Do NOT fill the background here; stylesheet handles it.
-        super().paintEvent(e)
-        p = QtGui.QPainter(self)
-        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
-
-        # Range strip under the title (unchanged)
+    def resizeEvent(self, e: QtGui.QResizeEvent) -> None:
+        self._rail_rect = None
+        super().resizeEvent(e)
+
+    def changeEvent(self, e: QtCore.QEvent) -> None:
+        # The strip sits below the title, so its y follows the title font
+        if e.type() in (QtCore.QEvent.Type.FontChange, QtCore.QEvent.Type.StyleChange):
+            self._rail_rect = None
+        super().changeEvent(e)
+
+    def _compute_strip_rects(self) -> None:
+        """Rail and group-span rects of the range strip under the title (span is None without a range)."""
         m = self.layout().contentsMargins()
         top_y = self.rect().y() + m.top()
-        fm = self.title.fontMetrics()
-        title_h = fm.height()
-        y = int(top_y + title_h + 8)
+        y = int(top_y + self.title.fontMetrics().height() + 8)
         h = 3
 
         left = self.rect().x() + m.left()
         right = self.rect().right() - m.right()
         width = max(0, right - left)
+        self._rail_rect = QtCore.QRect(left, y, width, h)
 
-        p.fillRect(QtCore.QRect(left, y, width, h), NOTE_RAIL_COLOR)
-
+        self._span_rect = None
         if self.in_s is not None and self.out_s is not None and self.out_s > self.in_s and width > 0:
             x0 = left + int((float(self.in_s) / self.duration_s) * width)
             x1 = left + int((float(self.out_s) / self.duration_s) * width)
-            span = QtCore.QRect(min(x0, x1), y, max(6, abs(x1 - x0)), h)
-            band = QtGui.QColor(self.layer.color);
-            band.setAlpha(int(255 * 0.40))
-            p.fillRect(span, band)
+            self._span_rect = QtCore.QRect(min(x0, x1), y, max(6, abs(x1 - x0)), h)
+
+    def paintEvent(self, e: QtGui.QPaintEvent) -> None:
+        # Do NOT fill the background here; stylesheet handles it.
+        super().paintEvent(e)
+        if self._rail_rect is None:
+            self._compute_strip_rects()
+        p = QtGui.QPainter(self)
+        p.setRenderHint(QtGui.QPainter.Antialiasing, True)
+
+        # Range strip under the title
+        p.fillRect(self._rail_rect, NOTE_RAIL_COLOR)
+
+        if self._span_rect is not None:
+            color = self.layer.color
+            if self._band_of is not color:
+                band = QtGui.QColor(color)
+                band.setAlpha(int(255 * 0.40))
+                self._band_color, self._band_of = band, color
+            p.fillRect(self._span_rect, self._band_color)
 
         p.end()
 
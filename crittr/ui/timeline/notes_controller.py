@@ -2,18 +2,21 @@ from PySide6 import QtCore
 from .notes_tree import Note  # use existing Note type
 
 class NotesController(QtCore.QObject):
-    def __init__(self, player, notes_panel):
+    def __init__(self, player, notes_panel, wire_playback: bool = True):
         super().__init__()
         self.player = player
         self.notes  = notes_panel
-        self._connect()
-
-    def _connect(self):
-        self.notes.groupActivated.connect(lambda _lid, s, _e: self._seek(s))
-        self.notes.noteActivated.connect(lambda _nid, s, _e, _lid: self._seek(s))
-        self.notes.notePillDragStarted.connect(self._on_drag_start)
-        self.notes.notePillDragging.connect(self._on_drag)
-        self.notes.notePillDragFinished.connect(self._on_drag_finish)
+        self._connect(wire_playback)
+
+    def _connect(self, wire_playback: bool):
+        # Hosts that route activation/pill drags to playback themselves (MainWindow) pass
+        # wire_playback=False, so each click/drag event drives exactly one seek/preview.
+        if wire_playback:
+            self.notes.groupActivated.connect(lambda _lid, s, _e: self._seek(s))
+            self.notes.noteActivated.connect(lambda _nid, s, _e, _lid: self._seek(s))
+            self.notes.notePillDragStarted.connect(self._on_drag_start)
+            self.notes.notePillDragging.connect(self._on_drag)
+            self.notes.notePillDragFinished.connect(self._on_drag_finish)
         self.notes.addNoteRequested.connect(self._on_add_note)
         # Drawing actions (stub for MVP)
         self.notes.noteDrawingAddRequested.connect(self._noop)
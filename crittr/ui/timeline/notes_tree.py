@@ -135,11 +135,14 @@ class NotesTree(QtWidgets.QTreeWidget):
         hdr = self._layer_headers.get(layer_id)
         return hdr.layer if hdr else None
 
-    def add_layer_simple(self, name: str, color: QtGui.QColor) -> str:
-        """Create a new layer with no notes and return its id."""
+    def add_layer_simple(self, name: str, color: QtGui.QColor, notes: Optional[List[Note]] = None) -> str:
+        """Create a new layer (optionally with notes, rebound to the new id) and return its id."""
         lid = self._alloc_layer_id(name)
         layer = Layer(lid, name.strip() or "Layer", True, False, color if color.isValid() else QtGui.QColor("#8ab4f8"))
-        self.add_layer(layer, [])
+        notes = notes or []
+        for n in notes:
+            n.layer_id = lid
+        self.add_layer(layer, notes)
         return lid
 
     def add_note(self, layer_id: str, note: Note) -> None:
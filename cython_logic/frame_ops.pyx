@@ -0,0 +1,22 @@
+# cython: boundscheck=False, wraparound=False, initializedcheck=False
+from libc.string cimport memcpy
+
+
+def unpack_rgb24(const unsigned char[::1] buf, Py_ssize_t h, Py_ssize_t w, Py_ssize_t stride,
+                 unsigned char[:, :, ::1] out):
+    """Copy h rows of packed 24-bit pixels (row pitch `stride` bytes) into out[h, w, 3]."""
+    cdef Py_ssize_t row_bytes = 3 * w
+    cdef Py_ssize_t y
+    if out.shape[0] != h or out.shape[1] != w or out.shape[2] != 3:
+        raise ValueError("out must have shape (h, w, 3)")
+    if stride < row_bytes or buf.shape[0] < (h - 1) * stride + row_bytes:
+        raise ValueError("buffer too small for the given size/stride")
+    if h == 0 or w == 0:
+        return
+    with nogil:
+        if stride == row_bytes:
+            memcpy(&out[0, 0, 0], &buf[0], h * row_bytes)
+        else:
+            for y in range(h):
+                memcpy(&out[y, 0, 0], &buf[y * stride], row_bytes)
+
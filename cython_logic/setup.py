@@ -3,5 +3,5 @@ from Cython.Build import cythonize
 
 setup(
     name="secure_logic",
-    ext_modules=cythonize("secure_logic.pyx", compiler_directives={"language_level": "3"}),
+    ext_modules=cythonize(["secure_logic.pyx", "timing.pyx", "frame_ops.pyx"], compiler_directives={"language_level": "3"}),
 )
@@ -0,0 +1,21 @@
+from libc.math cimport rint
+
+
+cpdef long long pts_to_ms(double pts_s) noexcept nogil:
+    if pts_s <= 0.0:
+        return 0
+    return <long long>rint(pts_s * 1000.0)
+
+
+cpdef double ms_to_pts(long long ms) noexcept nogil:
+    if ms <= 0:
+        return 0.0
+    return ms / 1000.0
+
+
+cpdef long long frame_of(double pts_s, double fps_est) noexcept nogil:
+    if pts_s <= 0.0:
+        return 0
+    if fps_est < 1e-6:
+        fps_est = 1e-6
+    return <long long>rint(pts_s * fps_est)
@@ -1,15 +1,37 @@
 # crittr/app.py
 from __future__ import annotations
 import sys
-from crittr.qt import QtWidgets, QtGui, QtCore
-from app_config import ensure_app_dirs, apply_qsettings_org, banner
+import argparse
+from app_config import (
+    ensure_app_dirs, apply_qsettings_org, banner,
+    APP_NAME, APP_DESCRIPTION, CLI_NAME, CLI_EXAMPLES, version_string,
+)
 from crittr.core.logging import setup_logging
-from crittr.ui.main_window import MainWindow
-from crittr.ui.theme import apply_fusion_theme
 import logging
 
 
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog=CLI_NAME,
+        description=APP_DESCRIPTION,
+        epilog=CLI_EXAMPLES,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--version", action="version", version=f"{APP_NAME} {version_string()}")
+    # Unknown args are left for Qt (e.g. -style, -platform)
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
 def main() -> int:
+    # --help/--version exit here, before any Qt import cost is paid
+    _parse_args(sys.argv[1:])
+
+    # Qt and the UI are imported only once a window is actually needed
+    from crittr.qt import QtWidgets
+    from crittr.ui.main_window import MainWindow
+    from crittr.ui.theme import apply_fusion_theme
+
     ensure_app_dirs()
     apply_qsettings_org()
     logger = setup_logging(level=logging.DEBUG)
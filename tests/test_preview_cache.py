@@ -0,0 +1,61 @@
+"""Exact-frame preview cache keys (run with `python -m pytest` from the repo root)."""
+import threading
+from collections import OrderedDict
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("PySide6")
+
+from crittr.core.video import VideoBackendFFPyPlayer  # noqa: E402
+
+
+class _FakeBackend:
+    """Cache logic of the real backend over a synthetic 25 fps decoder (pixel value = frame index)."""
+    get_preview_frame_at = VideoBackendFFPyPlayer.get_preview_frame_at
+    cached_frame = VideoBackendFFPyPlayer.cached_frame
+    _frame_index = VideoBackendFFPyPlayer._frame_index
+    _cache_put = VideoBackendFFPyPlayer._cache_put
+
+    def __init__(self, fps: float = 25.0):
+        self._frame_s = 1.0 / fps
+        self._preview_lock = threading.Lock()
+        self._preview_cache = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_max_bytes = 1 << 20
+        self.decodes = 0
+
+    def snap_to_keyframe(self, seconds, direction=-1):
+        return None
+
+    def _av_preview_at(self, seconds, exact):
+        # Like PyAV: the frame on screen at `seconds` is the one whose [pts, pts + frame_s) covers it
+        self.decodes += 1
+        i = int(seconds / self._frame_s + 1e-9)
+        return np.full((2, 2, 3), i, dtype=np.uint8), i * self._frame_s
+
+    def _cv_preview_at(self, seconds):
+        return None
+
+
+def _index(bgr):
+    return int(bgr[0, 0, 0])
+
+
+def test_neighbouring_exact_lookups_return_distinct_frames():
+    b = _FakeBackend()
+    assert _index(b.get_preview_frame_at(0.039, exact=True)) == 0
+    assert _index(b.get_preview_frame_at(0.04, exact=True)) == 1
+    assert _index(b.get_preview_frame_at(3.5, exact=True)) == 87
+    assert _index(b.get_preview_frame_at(3.52, exact=True)) == 88
+
+
+def test_exact_entries_are_keyed_by_the_decoded_frame():
+    b = _FakeBackend()
+    b.get_preview_frame_at(3.5, exact=True)
+    assert _index(b.cached_frame(3.48)) == 87
+    assert b.cached_frame(3.52) is None
+    decodes = b.decodes
+    assert _index(b.get_preview_frame_at(3.49, exact=True)) == 87
+    assert b.decodes == decodes  # served from the cache